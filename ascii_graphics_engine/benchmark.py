@@ -0,0 +1,149 @@
+import platform
+import time
+import tracemalloc
+
+import numpy as np
+
+from .renderer.solidfillrenderer import SolidFillRenderer
+from .renderer.wireframerenderer import WireFrameRenderer
+from .shapes.solids import SOLIDS
+
+
+class _NullOutput:
+    """A text stream that discards everything written to it, counting the bytes."""
+
+    def __init__(self):
+        self.written = 0
+
+    def write(self, text):
+        self.written += len(text)
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+class Benchmark:
+    """Measures how fast renderers draw solids at a range of screen sizes.
+
+    Every combination of renderer, solid and size is run for a fixed number of frames with the output discarded.
+    Each frame is split into the transform (Shape.rotate), rasterize (Renderer._render) and present
+    (Renderer._draw_screen) stages, which are timed separately. A second pass under tracemalloc records the peak
+    memory allocated while producing a frame, so allocation tracing does not distort the timings.
+
+    Args:
+        renderers (list, optional): The renderer names to run. Defaults to every renderer.
+        solids (list, optional): The solid names to run. Defaults to every solid.
+        sizes (list, optional): The screen sizes to run. Defaults to 10, 20 and 40.
+        frames (int, optional): The number of timed frames per combination. Defaults to 100.
+        warmup (int, optional): The number of untimed frames run first. Defaults to 5.
+        allocations (bool, optional): Whether to run the allocation pass. Defaults to True.
+
+    Attributes:
+        renderers (list): The renderer names to run.
+        solids (list): The solid names to run.
+        sizes (list): The screen sizes to run.
+        frames (int): The number of timed frames per combination.
+        warmup (int): The number of untimed frames run first.
+        allocations (bool): Whether the allocation pass is run.
+
+    Methods:
+        measure(renderer: str, solid: str, size: int): Benchmarks one combination.
+        run(): Benchmarks every combination.
+    """
+
+    RENDERERS = {
+        "wire": lambda shape, size, output: WireFrameRenderer(shape, offset=size, output=output),
+        "fill": lambda shape, size, output: SolidFillRenderer(shape, offset=size, output=output),
+        "fill-z": lambda shape, size, output: SolidFillRenderer(shape, offset=size, output=output, z_buffer=True),
+        "fill-shade": lambda shape, size, output: SolidFillRenderer(shape, offset=size, output=output, shading=True),
+    }
+    SOLIDS = SOLIDS
+    STAGES = ("transform", "rasterize", "present")
+
+    def __init__(self, renderers=None, solids=None, sizes=(10, 20, 40), frames=100, warmup=5, allocations=True):
+        self.renderers = list(renderers or self.RENDERERS)
+        self.solids = list(solids or self.SOLIDS)
+        self.sizes = list(sizes)
+        self.frames = frames
+        self.warmup = warmup
+        self.allocations = allocations
+
+    def __frame(self, renderer, clock):
+        """Runs one frame and returns the time each stage finished."""
+        start = clock()
+        renderer.shape.rotate()
+        transformed = clock()
+        renderer._render()
+        rasterized = clock()
+        renderer._draw_screen()
+        return start, transformed, rasterized, clock()
+
+    def measure(self, renderer, solid, size):
+        """Benchmark one renderer drawing one solid at one size.
+
+        Args:
+            renderer (str): The renderer name.
+            solid (str): The solid name.
+            size (int): The screen size.
+
+        Returns:
+            dict: The frame rate, per-stage timings in milliseconds, bytes written and peak allocation per frame.
+        """
+        output = _NullOutput()
+        subject = self.RENDERERS[renderer](self.SOLIDS[solid](size), size, output)
+        for _ in range(self.warmup):
+            self.__frame(subject, time.perf_counter)
+        output.written = 0
+        marks = np.array([self.__frame(subject, time.perf_counter) for _ in range(self.frames)])
+        stages = np.diff(marks, axis=1) * 1000
+        total = marks[-1, -1] - marks[0, 0]
+        result = {
+            "renderer": renderer,
+            "solid": solid,
+            "size": size,
+            "frames": self.frames,
+            "fps": self.frames / total if total > 0 else float("inf"),
+            "frame_ms": float(np.mean(marks[:, -1] - marks[:, 0]) * 1000),
+            "stages": {
+                stage: {
+                    "mean_ms": float(np.mean(stages[:, k])),
+                    "median_ms": float(np.median(stages[:, k])),
+                    "p95_ms": float(np.percentile(stages[:, k], 95)),
+                } for k, stage in enumerate(self.STAGES)
+            },
+            "bytes_per_frame": output.written / self.frames,
+        }
+        if self.allocations:
+            result["peak_alloc_bytes_per_frame"] = self.__allocations(subject)
+        return result
+
+    def __allocations(self, renderer):
+        """Returns the mean peak memory allocated while producing a frame, traced with tracemalloc."""
+        peaks = []
+        tracemalloc.start()
+        try:
+            for _ in range(self.frames):
+                tracemalloc.reset_peak()
+                baseline, _ = tracemalloc.get_traced_memory()
+                self.__frame(renderer, time.perf_counter)
+                peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+        finally:
+            tracemalloc.stop()
+        return float(np.mean(peaks))
+
+    def run(self):
+        """Benchmark every combination of renderer, solid and size.
+
+        Returns:
+            dict: The environment and settings of the run and a list of results, one per combination.
+        """
+        return {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "frames": self.frames,
+            "warmup": self.warmup,
+            "results": [self.measure(renderer, solid, size)
+                        for renderer in self.renderers for solid in self.solids for size in self.sizes],
+        }
@@ -0,0 +1,172 @@
+import asyncio
+
+import numpy as np
+
+
+class _Client:
+    """The delivery state of one connected client: the newest frame it has not been sent yet."""
+
+    def __init__(self, writer):
+        self.writer = writer
+        self.frame = None
+        self.ready = asyncio.Event()
+        self.sent = 0
+        self.dropped = 0
+
+    def offer(self, frame):
+        """Replaces the pending frame with a newer one, counting the replaced frame as dropped."""
+        if self.frame is not None:
+            self.dropped += 1
+        self.frame = frame
+        self.ready.set()
+
+
+class BroadcastServer:
+    """Streams the frames of one renderer to any number of TCP clients, such as telnet or netcat.
+
+    Every frame is rendered and encoded once, and the same bytes are offered to every client. Each client is
+    served by its own task holding at most one pending frame: a frame that arrives while the client is still
+    draining the previous one replaces the pending frame, so a slow client skips stale frames instead of
+    buffering them without limit, and never holds up the render loop or the other clients.
+
+    Args:
+        renderer (Renderer): The renderer producing the frames.
+        host (str, optional): The address to listen on. Defaults to "127.0.0.1".
+        port (int, optional): The port to listen on, or 0 to pick a free one. Defaults to 2323.
+
+    Attributes:
+        renderer (Renderer): The renderer producing the frames.
+        host (str): The address to listen on.
+        port (int): The port to listen on, updated to the bound port once serving.
+        frames (int): The number of frames rendered.
+        connections (int): The number of clients that have connected.
+
+    Methods:
+        serve(frames: int, duration: float, workers: int, pipelined: bool, cache: FrameCache): Renders and
+            streams frames until stopped.
+        run(frames: int, duration: float, workers: int, pipelined: bool, cache: FrameCache): Runs serve in a new
+            event loop.
+        stats(): Returns the number of clients and the frames sent to and dropped for them.
+        __encode(frame: numpy.ndarray): Encodes a frame as bytes redrawing the terminal from the top left.
+        __next_frame(frames): Renders and encodes the next frame.
+        __handle(reader, writer): Streams frames to one client until it disconnects.
+
+    Note:
+        Each client's transport buffers at most one frame before it counts as slow, and clients still holding
+        unsent data LINGER seconds after the server stops are disconnected. Frames are rendered on a worker thread
+        so accepting, writing to and dropping clients stays responsive while a frame is rasterized. Rows end in
+        CRLF so raw telnet clients draw them correctly.
+    """
+
+    ENTER = b"\x1b[?25l\x1b[2J"
+    HOME = b"\x1b[H"
+    LINGER = 1.0
+
+    def __init__(self, renderer, host="127.0.0.1", port=2323):
+        self.renderer = renderer
+        self.host = host
+        self.port = port
+        self.frames = 0
+        self.connections = 0
+        self.__clients = set()
+        self.__dropped = 0
+        self.__sent = 0
+
+    def __encode(self, frame):
+        """Encodes a frame as bytes that redraw the terminal from the top left, rows ending in CRLF."""
+        rows = np.empty((frame.shape[0], frame.shape[1] + 2), dtype=np.uint8)
+        rows[:, :-2] = frame
+        rows[:, -2:] = (ord("\r"), ord("\n"))
+        return self.HOME + rows.tobytes()
+
+    def __next_frame(self, frames):
+        """Renders and encodes the next frame, or returns None once the frames run out."""
+        try:
+            return self.__encode(next(frames)[1])
+        except StopIteration:
+            return None
+
+    async def __handle(self, reader, writer):
+        """Streams frames to one client until it disconnects, dropping frames it is too slow to receive."""
+        client = _Client(writer)
+        self.__clients.add(client)
+        self.connections += 1
+        rows, columns = self.renderer.pixels.shape
+        writer.transport.set_write_buffer_limits(high=len(self.HOME) + rows * (columns + 2))
+        try:
+            writer.write(self.ENTER)
+            while True:
+                await client.ready.wait()
+                client.ready.clear()
+                if client.frame is None:
+                    break
+                frame, client.frame = client.frame, None
+                writer.write(frame)
+                await writer.drain()
+                client.sent += 1
+        except ConnectionError:
+            pass
+        finally:
+            self.__clients.discard(client)
+            self.__dropped += client.dropped
+            self.__sent += client.sent
+            writer.close()
+
+    async def serve(self, frames=None, duration=None, workers=0, pipelined=False, cache=None):
+        """Render frames at the renderer's timeout and stream them to every connected client.
+
+        Args:
+            frames (int, optional): Stop after this many frames. Defaults to None.
+            duration (float, optional): Stop after this many seconds. Defaults to None.
+            workers (int, optional): Render bands of rows on this many processes. Defaults to 0.
+            pipelined (bool, optional): With workers, render the next frame ahead of time. Defaults to False.
+            cache (FrameCache, optional): Reuse finished frames of repeated orientations. Defaults to None.
+        """
+        loop = asyncio.get_running_loop()
+        server = await asyncio.start_server(self.__handle, self.host, self.port)
+        self.port = server.sockets[0].getsockname()[1]
+        rendered = self.renderer.frames(frames, duration, workers, pipelined, cache)
+        rendering = None
+        try:
+            deadline = loop.time()
+            while True:
+                rendering = loop.run_in_executor(None, self.__next_frame, rendered)
+                frame = await rendering
+                if frame is None:
+                    break
+                self.frames += 1
+                for client in self.__clients:
+                    client.offer(frame)
+                deadline += self.renderer.timeout
+                await asyncio.sleep(max(deadline - loop.time(), 0))
+        finally:
+            if rendering is not None and not rendering.done():
+                await asyncio.wait({rendering})
+            rendered.close()
+            server.close()
+            clients = list(self.__clients)
+            for client in clients:
+                client.frame = None
+                client.ready.set()
+            closing = asyncio.gather(*(client.writer.wait_closed() for client in clients), return_exceptions=True)
+            try:
+                await asyncio.wait_for(closing, self.LINGER)
+            except asyncio.TimeoutError:
+                for client in clients:
+                    client.writer.transport.abort()
+            await server.wait_closed()
+
+    def run(self, frames=None, duration=None, workers=0, pipelined=False, cache=None):
+        """Serve frames in a new event loop until stopped. Takes the same arguments as serve."""
+        asyncio.run(self.serve(frames, duration, workers, pipelined, cache))
+
+    def stats(self):
+        """Get the number of clients and the frames sent to and dropped for them.
+
+        Returns:
+            dict: The frames rendered, clients connected now and in total, and frames sent and dropped.
+        """
+        clients = list(self.__clients)
+        return {"frames": self.frames, "clients": len(clients), "connections": self.connections,
+                "sent": self.__sent + sum(client.sent for client in clients),
+                "dropped": self.__dropped + sum(client.dropped for client in clients)}
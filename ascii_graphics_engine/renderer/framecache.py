@@ -0,0 +1,96 @@
+from collections import OrderedDict
+
+
+class FrameCache:
+    """Stores finished frames so repeated orientations are not rasterized again.
+
+    Frames are evicted least recently used first once their total size exceeds the byte budget. Keys are built
+    by the renderer from the shape, the rendering mode, the screen size and the orientation step, wrapped to
+    the shape's rotation period so a repeating animation settles into playing back cached frames.
+
+    Args:
+        budget (int, optional): The maximum number of bytes of frames to hold. Defaults to 64 MiB.
+
+    Attributes:
+        budget (int): The maximum number of bytes of frames to hold.
+        size (int): The number of bytes of frames currently held.
+        hits (int): The number of lookups that found a frame.
+        misses (int): The number of lookups that did not find a frame.
+        evictions (int): The number of frames dropped to stay within the budget.
+
+    Methods:
+        get(key): Returns the frame stored under a key, or None.
+        put(key, frame): Stores a frame under a key, evicting old frames as needed.
+        stats(): Returns the hit, miss and size statistics.
+        clear(): Drops every stored frame.
+    """
+
+    def __init__(self, budget=64 * 1024 * 1024):
+        self.budget = budget
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.__frames = OrderedDict()
+
+    def __len__(self):
+        return len(self.__frames)
+
+    def get(self, key):
+        """Get the frame stored under a key, marking it as recently used.
+
+        Args:
+            key: The key the frame was stored under.
+
+        Returns:
+            numpy.ndarray: The stored frame, or None if it is not cached.
+        """
+        frame = self.__frames.get(key)
+        if frame is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.__frames.move_to_end(key)
+        return frame
+
+    def put(self, key, frame):
+        """Store a frame under a key, evicting the least recently used frames to stay within the budget.
+
+        Frames larger than the whole budget are not stored.
+
+        Args:
+            key: The key to store the frame under.
+            frame (numpy.ndarray): The frame to store. It is not copied.
+        """
+        if frame.nbytes > self.budget:
+            return
+        previous = self.__frames.pop(key, None)
+        if previous is not None:
+            self.size -= previous.nbytes
+        self.__frames[key] = frame
+        self.size += frame.nbytes
+        while self.size > self.budget:
+            _, evicted = self.__frames.popitem(last=False)
+            self.size -= evicted.nbytes
+            self.evictions += 1
+
+    def stats(self):
+        """Get the cache statistics.
+
+        Returns:
+            dict: The hits, misses, hit rate, evictions, stored frame count and bytes held.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "frames": len(self.__frames),
+            "bytes": self.size,
+        }
+
+    def clear(self):
+        """Drop every stored frame, keeping the statistics."""
+        self.__frames.clear()
+        self.size = 0
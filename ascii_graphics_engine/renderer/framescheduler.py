@@ -0,0 +1,69 @@
+import time
+
+
+class FrameScheduler:
+    """Paces a render loop on a fixed timestep.
+
+    Iterating the scheduler yields once per frame. Frame k is due at start + k * period, so the time spent
+    rendering is taken out of the sleep instead of being added to it and the frame rate does not drift with
+    load. When frame_skip is enabled and the loop falls more than a frame behind, the late frames are yielded
+    with present set to False so the caller can advance the animation without drawing it.
+
+    Args:
+        period (float): The target time between frames in seconds.
+        frames (int, optional): Stop after this many frames. Defaults to None, which never stops.
+        duration (float, optional): Stop once this many seconds have elapsed. Defaults to None.
+        frame_skip (bool, optional): Skip presenting frames that are running late. Defaults to False.
+        clock (callable, optional): Returns the current time in seconds. Defaults to time.perf_counter.
+        sleep (callable, optional): Sleeps for the provided number of seconds. Defaults to time.sleep.
+
+    Attributes:
+        period (float): The target time between frames in seconds.
+        frames (int): The maximum number of frames, or None.
+        duration (float): The maximum run time in seconds, or None.
+        frame_skip (bool): Whether late frames are skipped.
+        presented (int): The number of frames yielded for presentation.
+        skipped (int): The number of frames yielded as skipped.
+
+    Methods:
+        fps(): Returns the target frame rate.
+    """
+
+    def __init__(self, period, frames=None, duration=None, frame_skip=False, clock=time.perf_counter,
+                 sleep=time.sleep):
+        self.period = period
+        self.frames = frames
+        self.duration = duration
+        self.frame_skip = frame_skip
+        self.presented = 0
+        self.skipped = 0
+        self.__clock = clock
+        self.__sleep = sleep
+
+    def fps(self):
+        """Get the target frame rate.
+
+        Returns:
+            float: Frames per second, or infinity when the period is zero.
+        """
+        return 1 / self.period if self.period > 0 else float("inf")
+
+    def __iter__(self):
+        """Yield whether each frame should be presented, sleeping only for the remaining frame budget."""
+        start = self.__clock()
+        frame = 0
+        while self.frames is None or frame < self.frames:
+            now = self.__clock()
+            if self.duration is not None and now - start >= self.duration:
+                return
+            due = start + frame * self.period
+            present = not (self.frame_skip and now - due > self.period)
+            if present:
+                self.presented += 1
+            else:
+                self.skipped += 1
+            yield present
+            frame += 1
+            remaining = start + frame * self.period - self.__clock()
+            if remaining > 0:
+                self.__sleep(remaining)
@@ -0,0 +1,123 @@
+import json
+import time
+
+import numpy as np
+
+
+class Instrumentation:
+    """Records per-stage timings and counters of recent frames in a fixed-size ring buffer.
+
+    A renderer with instrumentation attached marks the end of each stage of a frame and adds to the counters
+    while it works. Renderers only touch the instrumentation when it is attached, so leaving it detached costs a
+    single attribute check per stage.
+
+    Args:
+        capacity (int, optional): The number of most recent frames kept. Defaults to 300.
+        overlay (bool, optional): Whether renderers draw a status line below each frame. Defaults to False.
+        clock (callable, optional): Returns the current time in seconds. Defaults to time.perf_counter.
+
+    Attributes:
+        capacity (int): The number of most recent frames kept.
+        overlay (bool): Whether renderers draw a status line below each frame.
+        frames (int): The number of frames recorded in total.
+
+    Methods:
+        begin(): Starts recording a frame.
+        lap(stage: str): Adds the time since the previous mark to a stage of the current frame.
+        count(counter: str, value: int): Adds to a counter of the current frame.
+        end(): Finishes recording the current frame.
+        records(): Returns the kept frames, oldest first.
+        summary(): Returns the rolling frame rate and mean stage timings and counters.
+        status(): Returns a one-line summary for display under a frame.
+        export(path: str): Writes the kept frames to a JSON lines file.
+    """
+
+    STAGES = ("transform", "rasterize", "present")
+    COUNTERS = ("pixels_tested", "faces_drawn", "bytes_written")
+
+    def __init__(self, capacity=300, overlay=False, clock=time.perf_counter):
+        self.capacity = capacity
+        self.overlay = overlay
+        self.frames = 0
+        self.__clock = clock
+        self.__records = np.zeros(capacity, dtype=[("start", "f8")] + [(stage, "f8") for stage in self.STAGES]
+                                  + [(counter, "i8") for counter in self.COUNTERS])
+        self.__index = 0
+        self.__mark = 0.0
+
+    def begin(self):
+        """Start recording a frame, overwriting the oldest kept frame once the buffer is full."""
+        self.__index = self.frames % self.capacity
+        self.__records[self.__index] = 0
+        self.__mark = self.__clock()
+        self.__records["start"][self.__index] = self.__mark
+
+    def lap(self, stage):
+        """Add the time since the previous mark to a stage of the current frame.
+
+        Args:
+            stage (str): One of STAGES.
+        """
+        now = self.__clock()
+        self.__records[stage][self.__index] += now - self.__mark
+        self.__mark = now
+
+    def count(self, counter, value):
+        """Add to a counter of the current frame.
+
+        Args:
+            counter (str): One of COUNTERS.
+            value (int): The amount to add.
+        """
+        self.__records[counter][self.__index] += value
+
+    def end(self):
+        """Finish recording the current frame."""
+        self.frames += 1
+
+    def records(self):
+        """Get the kept frames.
+
+        Returns:
+            numpy.ndarray: A structured array of the kept frames, oldest first.
+        """
+        if self.frames <= self.capacity:
+            return self.__records[:self.frames].copy()
+        return np.roll(self.__records, -(self.frames % self.capacity))
+
+    def summary(self):
+        """Get the rolling frame rate and the mean stage timings and counters over the kept frames.
+
+        Returns:
+            dict: The frame rate, stage timings in milliseconds and counters per frame.
+        """
+        records = self.records()
+        elapsed = records["start"][-1] - records["start"][0] if len(records) > 1 else 0.0
+        summary = {"frames": len(records), "fps": (len(records) - 1) / elapsed if elapsed > 0 else 0.0}
+        for stage in self.STAGES:
+            summary[f"{stage}_ms"] = float(records[stage].mean() * 1000) if len(records) else 0.0
+        for counter in self.COUNTERS:
+            summary[counter] = float(records[counter].mean()) if len(records) else 0.0
+        return summary
+
+    def status(self):
+        """Get a one-line summary of the kept frames for display under a frame.
+
+        Returns:
+            str: The rolling frame rate, stage breakdown and counters.
+        """
+        summary = self.summary()
+        stages = " ".join(f"{stage} {summary[f'{stage}_ms']:.2f}ms" for stage in self.STAGES)
+        return (f"{summary['fps']:5.1f} fps | {stages} | faces {summary['faces_drawn']:.0f} "
+                f"pixels {summary['pixels_tested']:.0f} bytes {summary['bytes_written']:.0f}")
+
+    def export(self, path):
+        """Write the kept frames to a file with one JSON object per frame.
+
+        Args:
+            path (str): The path of the file to write.
+        """
+        records = self.records()
+        with open(path, "w") as file:
+            for record in records:
+                file.write(json.dumps({name: record[name].item() for name in records.dtype.names}) + "\n")
@@ -1,4 +1,13 @@
+import sys
+import time
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+
+import numpy as np
+
+from .framescheduler import FrameScheduler
+from .terminaldiff import TerminalDiff
+from .tiledpool import TiledPool
 
 
 class Renderer(ABC):
@@ -7,38 +16,298 @@ class Renderer(ABC):
     Args:
         shape: The shape to be rendered.
         offset (int): The offset value determining the screen size.
+        timeout (float, optional): The target time between rendered frames in seconds. Defaults to 0.05.
+        frame_skip (bool, optional): Skip drawing frames that run late so the animation keeps real-time pacing.
+            Defaults to False.
+        output (optional): The text stream frames are written to. Defaults to sys.stdout.
+        incremental (bool, optional): Draw in place on the alternate screen, writing only the cells that changed
+            since the previous frame. Defaults to False.
 
     Attributes:
         offset (int): The offset value determining the screen size.
         shape: The shape to be rendered.
-        pixels (list): A 2D list representing the screen pixels.
+        timeout (float): The target time between rendered frames in seconds.
+        frame_skip (bool): Whether frames running late are skipped.
+        output: The text stream frames are written to.
+        pixels (numpy.ndarray): A 2D uint8 array holding the character code of every screen pixel.
+        terminal (TerminalDiff): Tracks the shown frame in incremental mode, None otherwise.
+        band (tuple): The (start, stop) rows of the screen that rendering is limited to.
+        instrumentation (Instrumentation): Records stage timings and counters of every frame when attached.
+            Defaults to None, which records nothing.
+        scaler (ResolutionScaler): Chooses a reduced resolution to rasterize at when frames run over budget.
+            Defaults to None, which always rasterizes at the screen resolution.
+        scale (float): The ratio of the grid being rasterized to the screen, below 1.0 only while a reduced
+            frame is rendered.
 
     Methods:
         __clear(): Clears the screen pixels.
+        __render_scaled(scale: float): Rasterizes a reduced grid and upscales it to the screen.
+        __measure(started: float): Reports the time taken by a frame to the scaler.
+        __pool(workers: int, pipelined: bool): Provides a worker pool for the duration of a render loop.
+        __advance(render: bool, pool: TiledPool, cache: FrameCache): Rotates the shape a step and renders it.
+        __finish(started: float, rendered: bool): Ends the instrumentation record and timing of a frame.
+        _compose_frame(): Joins the screen pixels into a single frame of text.
         _draw_screen(): Draws the screen with the rendered shape.
-        run(wire_shape: bool): Abstract method to execute the rendering process.
+        _restore_screen(): Leaves the alternate screen used by incremental mode.
+        _render(): Abstract method drawing the shape into the screen pixels.
+        _vertices(): Returns the shape's vertices in the coordinates of the grid being rasterized.
+        _cache_key(): Describes the rendering mode for frame cache keys.
+        _frame_key(): Returns the frame cache key of the shape's current step.
+        _render_frame(pool, cache): Renders the current step, through the frame cache and worker pool if provided.
+        run(frames: int, duration: float, workers: int, pipelined: bool, cache: FrameCache): Rotates, renders and
+            draws the shape on a fixed timestep.
+        frames(frames: int, duration: float, workers: int, pipelined: bool, cache: FrameCache): Yields rendered
+            frames as fast as possible without drawing them.
     """
 
-    def __init__(self, shape, offset):
+    background = " "
+
+    def __init__(self, shape, offset, timeout=0.05, frame_skip=False, output=None, incremental=False):
         self.offset = offset
         self.shape = shape
-        self.pixels = [[" " for _ in range(self.offset * 2 + 1)] for _ in range(self.offset * 2 + 1)]
+        self.timeout = timeout
+        self.frame_skip = frame_skip
+        self.output = output
+        self.terminal = TerminalDiff(self.offset * 2 + 1, self.offset * 2 + 1) if incremental else None
+        self.pixels = np.full((self.offset * 2 + 1, self.offset * 2 + 1), ord(self.background), dtype=np.uint8)
+        self.band = (0, self.offset * 2 + 1)
+        self.instrumentation = None
+        self.scaler = None
+        self.scale = 1.0
+        self.__grids = {}
+        self.__rows = np.empty((self.offset * 2 + 1, self.offset * 2 + 2), dtype=np.uint8)
+        self.__rows[:, -1] = ord("\n")
+
+    def __getstate__(self):
+        """Leaves the output stream out when the renderer is sent to a worker process."""
+        state = dict(self.__dict__)
+        state["output"] = None
+        state["instrumentation"] = None
+        state["scaler"] = None
+        return state
 
     def __clear(self):
         """Clears the screen pixels."""
-        self.pixels = [[" " for _ in range(self.offset * 2 + 1)] for _ in range(self.offset * 2 + 1)]
+        self.pixels.fill(ord(self.background))
+
+    def __render_scaled(self, scale):
+        """Rasterizes the shape into a grid reduced by a scale and upscales it to the screen.
+
+        The reduced grid stands in for the screen pixels while the renderer draws, and every screen pixel then
+        takes the nearest pixel of the grid. The grid and the nearest-pixel indices are kept for each scale.
+        """
+        if scale not in self.__grids:
+            offset = max(round(self.offset * scale), 1)
+            grid = np.empty((offset * 2 + 1, offset * 2 + 1), dtype=np.uint8)
+            nearest = np.rint((np.arange(self.offset * 2 + 1) - self.offset) * offset / self.offset).astype(np.intp)
+            self.__grids[scale] = (offset, grid, np.clip(nearest + offset, 0, offset * 2))
+        offset, grid, nearest = self.__grids[scale]
+        pixels, screen_offset, band = self.pixels, self.offset, self.band
+        grid.fill(ord(self.background))
+        self.pixels, self.offset, self.band, self.scale = grid, offset, (0, offset * 2 + 1), offset / screen_offset
+        try:
+            self._render()
+        finally:
+            self.pixels, self.offset, self.band, self.scale = pixels, screen_offset, band, 1.0
+        pixels[...] = grid[nearest[:, None], nearest]
+
+    def __measure(self, started):
+        """Reports the time taken by the frame started at a perf_counter time to the scaler, if one is attached."""
+        if self.scaler is not None:
+            self.scaler.update(time.perf_counter() - started)
+
+    @contextmanager
+    def __pool(self, workers, pipelined):
+        """Provides a worker pool for the duration of a render loop, or None when rendering in this process."""
+        pool = TiledPool(self, workers, pipelined=pipelined) if workers else None
+        try:
+            yield pool
+        finally:
+            if pool is not None:
+                pool.close()
+
+    def __advance(self, render, pool, cache):
+        """Rotates the shape a step and renders it if requested, recording the stages with the instrumentation.
+
+        Returns:
+            float: The perf_counter time the frame started at, to pass to __finish.
+        """
+        started = time.perf_counter()
+        instrumentation = self.instrumentation
+        if instrumentation is not None:
+            instrumentation.begin()
+        self.shape.rotate()
+        if instrumentation is not None:
+            instrumentation.lap("transform")
+        if render:
+            self._render_frame(pool, cache)
+            if instrumentation is not None:
+                instrumentation.lap("rasterize")
+        return started
+
+    def __finish(self, started, rendered):
+        """Ends the instrumentation record of a frame and reports the time of a rendered frame to the scaler."""
+        if self.instrumentation is not None:
+            self.instrumentation.end()
+        if rendered:
+            self.__measure(started)
+
+    def _compose_frame(self):
+        """Joins the screen pixels into a single frame of text, top row first.
+
+        Returns:
+            str: The frame with every row terminated by a newline.
+        """
+        self.__rows[:, :-1] = self.pixels[::-1]
+        return self.__rows.tobytes().decode("ascii")
 
     def _draw_screen(self):
-        """Draws the screen with the rendered shape."""
-        print()
-        for i in range(len(self.pixels) - 1, -1, -1):
-            for j in range(len(self.pixels[0])):
-                print(self.pixels[i][j], sep="", end="")
-            print(end="\n")
-        print()
+        """Draws the screen with the rendered shape in a single buffered write.
+
+        With instrumentation attached and its overlay enabled, a status line is drawn below the frame.
+        """
+        output = self.output if self.output is not None else sys.stdout
+        instrumentation = self.instrumentation
+        overlay = instrumentation is not None and instrumentation.overlay
+        if self.terminal is None:
+            text = "\n" + self._compose_frame() + (instrumentation.status() + "\n" if overlay else "") + "\n"
+        else:
+            text = self.terminal.enter() if self.terminal.previous is None else ""
+            text += self.terminal.update(self.pixels[::-1])
+            if overlay:
+                text += f"\x1b[{self.pixels.shape[0] + 1};1H\x1b[2K" + instrumentation.status()
+        output.write(text)
+        output.flush()
+        if instrumentation is not None:
+            instrumentation.count("bytes_written", len(text))
         self.__clear()
 
+    def _restore_screen(self):
+        """Leaves the alternate screen if incremental mode has drawn on it."""
+        if self.terminal is not None and self.terminal.previous is not None:
+            output = self.output if self.output is not None else sys.stdout
+            output.write(self.terminal.exit())
+            output.flush()
+
     @abstractmethod
-    def run(self):
-        """Execute the rendering process."""
+    def _render(self):
+        """Draw the shape into the screen pixels."""
         pass
+
+    def _vertices(self):
+        """Get the shape's vertices in the coordinates of the grid being rasterized.
+
+        Returns:
+            numpy.ndarray: The vertices, shrunk by the scale while a reduced frame is rendered.
+        """
+        vertices = self.shape.get_vertices()
+        return vertices if self.scale == 1.0 else vertices * self.scale
+
+    def _cache_key(self):
+        """Describe the rendering mode for frame cache keys.
+
+        Returns:
+            tuple: Every setting of the renderer that changes the rendered frame.
+        """
+        return (type(self).__name__,)
+
+    def _frame_key(self):
+        """Get the frame cache key of the shape's current step.
+
+        The step is wrapped to the shape's rotation period, so orientations that repeat share a key.
+
+        Returns:
+            tuple: The shape fingerprint, rendering mode, screen size, rasterized scale and orientation step.
+        """
+        period = self.shape.period()
+        step = self.shape.step % period if period else self.shape.step
+        scale = self.scaler.scale if self.scaler is not None else 1.0
+        return self.shape.fingerprint(), self._cache_key(), self.offset, scale, step
+
+    def _render_frame(self, pool=None, cache=None):
+        """Render the shape's current step into the screen pixels.
+
+        While the scaler holds a reduced scale the frame is rasterized in this process at that scale, as the
+        smaller grid costs less than handing the frame to the workers. Frames rendered by the workers are copied
+        out of the pool's shared memory, so no view of it outlives the pool.
+
+        Args:
+            pool (TiledPool, optional): Renders the frame across worker processes. Defaults to None.
+            cache (FrameCache, optional): Supplies and stores finished frames. Defaults to None.
+        """
+        if cache is not None:
+            key = self._frame_key()
+            frame = cache.get(key)
+            if frame is not None:
+                self.pixels[...] = frame
+                return
+        scale = self.scaler.scale if self.scaler is not None else 1.0
+        if scale < 1.0:
+            self.__render_scaled(scale)
+        elif pool is None:
+            self._render()
+        else:
+            self.pixels[...] = pool.render(self.shape.step)
+        if cache is not None:
+            cache.put(key, self.pixels.copy())
+
+    def run(self, frames=None, duration=None, workers=0, pipelined=False, cache=None):
+        """Continuously rotates the shape and draws it, one frame every timeout seconds.
+
+        Args:
+            frames (int, optional): Stop after this many frames. Defaults to None, which runs forever.
+            duration (float, optional): Stop after this many seconds. Defaults to None, which runs forever.
+            workers (int, optional): Render bands of rows on this many processes. Defaults to 0, which renders in
+                the current process.
+            pipelined (bool, optional): With workers, render the next frame while the current one is drawn.
+                Defaults to False.
+            cache (FrameCache, optional): Reuse finished frames of repeated orientations. Defaults to None.
+
+        Returns:
+            FrameScheduler: The scheduler that paced the loop, holding the presented and skipped frame counts.
+        """
+        scheduler = FrameScheduler(self.timeout, frames, duration, self.frame_skip)
+        try:
+            with self.__pool(workers, pipelined) as pool:
+                for present in scheduler:
+                    started = self.__advance(present, pool, cache)
+                    if present:
+                        self._draw_screen()
+                        if self.instrumentation is not None:
+                            self.instrumentation.lap("present")
+                    self.__finish(started, present)
+        finally:
+            self._restore_screen()
+        return scheduler
+
+    def frames(self, frames=None, duration=None, workers=0, pipelined=False, cache=None):
+        """Rotate and render the shape as fast as possible, yielding each frame instead of drawing it.
+
+        Frames are timestamped in animation time, timeout seconds apart, so a recording plays back at the
+        configured rate however long it took to render.
+
+        Args:
+            frames (int, optional): Stop after this many frames. Defaults to None.
+            duration (float, optional): Stop after this many seconds of animation. Defaults to None.
+            workers (int, optional): Render bands of rows on this many processes. Defaults to 0.
+            pipelined (bool, optional): With workers, render the next frame ahead of time. Defaults to False.
+            cache (FrameCache, optional): Reuse finished frames of repeated orientations. Defaults to None.
+
+        Yields:
+            tuple: The timestamp in seconds and a 2D uint8 array of character codes, top row first. The array is a
+                view of the renderer's own pixels, never of worker shared memory, so it stays safe to read after the
+                generator finishes, but it is reused for the next frame and should be copied to be kept.
+
+        Raises:
+            ValueError: If a duration is given with a timeout that is not positive, as animation time would never
+                reach it.
+        """
+        if duration is not None and self.timeout <= 0:
+            raise ValueError(f"duration requires a positive timeout, got {self.timeout}")
+        with self.__pool(workers, pipelined) as pool:
+            frame = 0
+            while (frames is None or frame < frames) and (duration is None or frame * self.timeout < duration):
+                self.__finish(self.__advance(True, pool, cache), True)
+                yield frame * self.timeout, self.pixels[::-1]
+                self.__clear()
+                frame += 1
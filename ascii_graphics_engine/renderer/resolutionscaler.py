@@ -0,0 +1,76 @@
+import numpy as np
+
+
+class ResolutionScaler:
+    """Chooses the resolution a renderer rasterizes at to keep frame times within a budget.
+
+    The frame times reported to the scaler are averaged over a window of frames. When the average runs over the
+    budget the scale drops to the next lower level, and when the average would still fit comfortably at the next
+    higher level it is raised again. Rasterizing cost grows with the square of the scale, so the time a frame
+    would take one level up is predicted from that ratio, and raising requires it to fall below a lower
+    threshold than the one that triggers lowering. After every change the window is refilled before the scale
+    can change again. Together these keep the scale from oscillating between two levels.
+
+    Args:
+        budget (float): The frame time to stay within in seconds.
+        scales (tuple, optional): The scales to choose from, largest first. Defaults to (1.0, 0.75, 0.5, 0.25).
+        high (float, optional): The fraction of the budget the average must exceed to lower the scale.
+            Defaults to 0.9.
+        low (float, optional): The fraction of the budget the predicted average must stay below to raise the
+            scale. Defaults to 0.6.
+        window (int, optional): The number of frames averaged. Defaults to 10.
+
+    Attributes:
+        budget (float): The frame time to stay within in seconds.
+        scales (tuple): The scales to choose from, largest first.
+        high (float): The fraction of the budget the average must exceed to lower the scale.
+        low (float): The fraction of the budget the predicted average must stay below to raise the scale.
+        level (int): The index of the current scale.
+        scale (float): The current scale, 1.0 being the full screen resolution.
+        changes (int): The number of times the scale has changed.
+
+    Methods:
+        update(elapsed: float): Records the time taken by a frame and adjusts the scale.
+        __change(step: int): Moves the scale by a number of levels.
+    """
+
+    def __init__(self, budget, scales=(1.0, 0.75, 0.5, 0.25), high=0.9, low=0.6, window=10):
+        self.budget = budget
+        self.scales = tuple(scales)
+        self.high = high
+        self.low = low
+        self.level = 0
+        self.changes = 0
+        self.__times = np.zeros(window)
+        self.__count = 0
+
+    @property
+    def scale(self):
+        """The current scale, 1.0 being the full screen resolution."""
+        return self.scales[self.level]
+
+    def update(self, elapsed):
+        """Record the time taken by a frame and adjust the scale once a full window has been recorded.
+
+        Args:
+            elapsed (float): The time taken by the frame in seconds.
+
+        Returns:
+            float: The scale for the following frame.
+        """
+        self.__times[self.__count % len(self.__times)] = elapsed
+        self.__count += 1
+        if self.__count < len(self.__times):
+            return self.scale
+        average = self.__times.mean()
+        if average > self.budget * self.high and self.level < len(self.scales) - 1:
+            self.__change(1)
+        elif self.level > 0 and average * (self.scales[self.level - 1] / self.scale) ** 2 < self.budget * self.low:
+            self.__change(-1)
+        return self.scale
+
+    def __change(self, step):
+        """Moves the scale by a number of levels and starts refilling the window."""
+        self.level += step
+        self.changes += 1
+        self.__count = 0
@@ -0,0 +1,130 @@
+import math
+import signal
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+_worker = {}
+
+
+def _attach(sheet):
+    """Keeps the sprite sheet sent to a worker process for the sprites it renders, leaving SIGINT to the parent."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _worker["sheet"] = sheet
+
+
+def _render_chunk(rotations):
+    """Renders a chunk of orientations in a worker process."""
+    return _worker["sheet"].render(rotations)
+
+
+class SpriteSheet:
+    """Renders a shape at many orientations at once into a stack of frames.
+
+    All orientations are applied to the shape's rest pose in a single batched matrix multiplication, and each
+    transformed pose is then rasterized by the renderer without advancing the shape, so any set of views can
+    be produced without driving the run loop. The frames can be split across worker processes and saved as a
+    single sprite sheet.
+
+    Args:
+        renderer (Renderer): The renderer drawing the frames.
+        workers (int, optional): Render chunks of orientations on this many processes. Defaults to 0, which
+            renders in the current process.
+
+    Attributes:
+        renderer (Renderer): The renderer drawing the frames.
+        workers (int): The number of worker processes, or 0.
+
+    Methods:
+        turntable(count: int, axis: tuple, tilt: numpy.ndarray): Returns evenly spaced rotations about an axis.
+        render(rotations: numpy.ndarray): Renders a frame for every orientation.
+        save(path: str, frames: numpy.ndarray, columns: int, gap: int): Saves frames as a sprite sheet.
+
+    Note:
+        The shape is returned to its current step once the frames are rendered, and the renderer's instrumentation
+        is detached meanwhile so the frames do not count as frames of its run loop. Each worker receives a copy of
+        the renderer and shape once, then only the orientations of its chunks.
+    """
+
+    def __init__(self, renderer, workers=0):
+        self.renderer = renderer
+        self.workers = workers
+
+    @staticmethod
+    def turntable(count, axis=(1, 0, 0), tilt=None):
+        """Get evenly spaced rotations of a full turn about an axis.
+
+        Args:
+            count (int): The number of rotations.
+            axis (tuple, optional): The axis turned about, along the row, column and viewer axes. Defaults to the
+                vertical axis of the screen, (1, 0, 0).
+            tilt (numpy.ndarray, optional): A 3x3 rotation applied before turning. Defaults to None.
+
+        Returns:
+            numpy.ndarray: An array of shape (count, 3, 3) to multiply row vectors by.
+        """
+        x, y, z = np.array(axis, dtype=float) / np.linalg.norm(axis)
+        cross = np.array([[0, -z, y], [z, 0, -x], [-y, x, 0]])
+        angles = 2 * np.pi * np.arange(count) / count
+        rotations = (np.eye(3) + np.sin(angles)[:, None, None] * cross
+                     + (1 - np.cos(angles))[:, None, None] * (cross @ cross)).transpose(0, 2, 1)
+        return rotations if tilt is None else tilt @ rotations
+
+    def render(self, rotations):
+        """Render a frame of the shape for every orientation.
+
+        Args:
+            rotations (numpy.ndarray): An array of shape (N, 3, 3) of orientations to multiply the rest pose by.
+
+        Returns:
+            numpy.ndarray: A uint8 array of shape (N, H, W) holding the character codes of every frame, top row
+                first.
+        """
+        rotations = np.asarray(rotations, dtype=float).reshape(-1, 3, 3)
+        if self.workers and len(rotations) > 1:
+            chunks = np.array_split(rotations, min(self.workers * 4, len(rotations)))
+            serial = SpriteSheet(self.renderer)
+            with ProcessPoolExecutor(self.workers, initializer=_attach, initargs=(serial,)) as executor:
+                return np.concatenate(list(executor.map(_render_chunk, chunks)))
+        renderer, shape = self.renderer, self.renderer.shape
+        vertices, normals = shape.poses(rotations)
+        frames = np.empty((len(rotations),) + renderer.pixels.shape, dtype=np.uint8)
+        pixels, band, instrumentation, step = renderer.pixels, renderer.band, renderer.instrumentation, shape.step
+        renderer.band, renderer.instrumentation = (0, pixels.shape[0]), None
+        try:
+            for k in range(len(rotations)):
+                shape.vertices, shape.normals = vertices[k], normals[k]
+                pixels.fill(ord(renderer.background))
+                renderer._render()
+                frames[k] = pixels[::-1]
+        finally:
+            renderer.band, renderer.instrumentation = band, instrumentation
+            pixels.fill(ord(renderer.background))
+            shape.seek(step)
+        return frames
+
+    @staticmethod
+    def save(path, frames, columns=None, gap=1):
+        """Save frames as a sprite sheet.
+
+        A path ending in .npy keeps the (N, H, W) array as is. Any other path is written as text, with the frames
+        tiled row by row and separated by blank cells.
+
+        Args:
+            path (str): The file to write.
+            frames (numpy.ndarray): The frames returned by render.
+            columns (int, optional): The number of frames per row of the sheet. Defaults to a square layout.
+            gap (int, optional): The number of blank cells between frames. Defaults to 1.
+        """
+        if path.endswith(".npy"):
+            np.save(path, frames)
+            return
+        count, height, width = frames.shape
+        columns = columns or max(math.ceil(math.sqrt(count)), 1)
+        rows = math.ceil(count / columns)
+        tiles = np.full((rows * columns, height + gap, width + gap), ord(" "), dtype=np.uint8)
+        tiles[:count, :height, :width] = frames
+        sheet = tiles.reshape(rows, columns, height + gap, width + gap).transpose(0, 2, 1, 3)
+        sheet = sheet.reshape(rows * (height + gap), columns * (width + gap))[:-gap or None, :-gap or None]
+        with open(path, "wb") as file:
+            file.write(np.hstack((sheet, np.full((len(sheet), 1), ord("\n"), dtype=np.uint8))).tobytes())
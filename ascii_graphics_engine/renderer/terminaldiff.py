@@ -0,0 +1,77 @@
+import numpy as np
+
+
+class TerminalDiff:
+    """Tracks the frame shown on an ANSI terminal and encodes only the cells that changed.
+
+    The frame is drawn in place on the terminal's alternate screen. Every update compares the new frame with
+    the previously shown one and emits each run of changed cells after a cursor-move escape sequence, so a
+    slowly moving shape costs a handful of bytes per frame instead of the whole grid.
+
+    Args:
+        rows (int): The number of rows in a frame.
+        columns (int): The number of columns in a frame.
+        gap (int, optional): Runs separated by at most this many unchanged cells are merged, as rewriting them
+            is cheaper than another cursor move. Defaults to 4.
+
+    Attributes:
+        previous (numpy.ndarray): The character codes currently shown on the terminal, or None before the first
+            update.
+        gap (int): The largest run of unchanged cells that is rewritten instead of skipped.
+
+    Methods:
+        enter(): Returns the sequence switching to the alternate screen.
+        exit(): Returns the sequence restoring the original screen.
+        update(frame): Returns the sequence turning the shown frame into the provided one.
+    """
+
+    def __init__(self, rows, columns, gap=4):
+        self.previous = None
+        self.gap = gap
+        self.__shape = (rows, columns)
+
+    def enter(self):
+        """Switch to the alternate screen, hide the cursor and clear the screen.
+
+        Returns:
+            str: The escape sequence to write to the terminal.
+        """
+        self.previous = None
+        return "\x1b[?1049h\x1b[?25l\x1b[2J"
+
+    def exit(self):
+        """Show the cursor and switch back to the original screen.
+
+        Returns:
+            str: The escape sequence to write to the terminal.
+        """
+        self.previous = None
+        return "\x1b[?25h\x1b[?1049l"
+
+    def update(self, frame):
+        """Encode the runs of cells that differ from the previously shown frame.
+
+        Args:
+            frame (numpy.ndarray): A 2D uint8 array of character codes, top row first.
+
+        Returns:
+            str: Cursor-move sequences each followed by the characters of one changed run.
+        """
+        if self.previous is None:
+            self.previous = np.zeros(self.__shape, dtype=np.uint8)
+        changed = frame != self.previous
+        edges = np.diff(changed.astype(np.int8), axis=1, prepend=0, append=0)
+        starts_row, starts_column = np.nonzero(edges == 1)
+        _, ends_column = np.nonzero(edges == -1)
+        if len(starts_row) > 1:
+            merge = (starts_row[1:] == starts_row[:-1]) & (starts_column[1:] - ends_column[:-1] <= self.gap)
+            keep_start = np.concatenate(([True], ~merge))
+            keep_end = np.concatenate((~merge, [True]))
+            starts_row, starts_column, ends_column = starts_row[keep_start], starts_column[keep_start], \
+                ends_column[keep_end]
+        chunks = []
+        for row, start, end in zip(starts_row.tolist(), starts_column.tolist(), ends_column.tolist()):
+            chunks.append(f"\x1b[{row + 1};{start + 1}H")
+            chunks.append(frame[row, start:end].tobytes().decode("ascii"))
+        self.previous[...] = frame
+        return "".join(chunks)
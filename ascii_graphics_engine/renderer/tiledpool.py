@@ -0,0 +1,113 @@
+import os
+import signal
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+_worker = {}
+
+
+def _attach(renderer, name):
+    """Keeps a copy of the renderer in the worker process and maps the shared framebuffers.
+
+    Workers ignore SIGINT so Ctrl-C is handled by the parent alone, which then shuts them down.
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    memory = shared_memory.SharedMemory(name=name)
+    _worker["memory"] = memory
+    _worker["renderer"] = renderer
+    _worker["buffers"] = np.ndarray((2,) + renderer.pixels.shape, dtype=np.uint8, buffer=memory.buf)
+
+
+def _render_band(buffer, step, rows):
+    """Renders one band of rows of a frame straight into a shared framebuffer."""
+    renderer = _worker["renderer"]
+    renderer.shape.seek(step)
+    renderer.pixels = _worker["buffers"][buffer]
+    renderer.band = rows
+    renderer.pixels[rows[0]:rows[1]].fill(ord(renderer.background))
+    renderer._render()
+
+
+class TiledPool:
+    """Renders frames in parallel bands of rows on a reusable process pool.
+
+    Every worker keeps its own copy of the renderer and its shape, so a frame is requested by sending only the
+    shape's step. The workers rasterize their band directly into one of two framebuffers held in shared memory,
+    so nothing is copied back to the parent. In pipelined mode the next frame is requested before the current
+    one is returned, letting the workers render frame N+1 while frame N is presented.
+
+    Args:
+        renderer (Renderer): The renderer whose shape and settings the workers use.
+        workers (int, optional): The number of worker processes. Defaults to the number of CPUs.
+        bands (int, optional): The number of row bands a frame is split into. Defaults to the number of workers.
+        pipelined (bool, optional): Render the following step ahead of time. Defaults to False.
+
+    Attributes:
+        workers (int): The number of worker processes.
+        pipelined (bool): Whether the following step is rendered ahead of time.
+        bands (list): The (start, stop) rows of every band.
+
+    Methods:
+        render(step: int): Returns the framebuffer holding the frame for a step.
+        close(): Shuts the workers down and releases the shared memory.
+    """
+
+    def __init__(self, renderer, workers=None, bands=None, pipelined=False):
+        self.workers = workers or os.cpu_count() or 1
+        self.pipelined = pipelined
+        rows = renderer.pixels.shape[0]
+        edges = np.linspace(0, rows, min(bands or self.workers, rows) + 1).round().astype(int).tolist()
+        self.bands = list(zip(edges[:-1], edges[1:]))
+        self.__memory = shared_memory.SharedMemory(create=True, size=2 * renderer.pixels.size)
+        self.__buffers = np.ndarray((2,) + renderer.pixels.shape, dtype=np.uint8, buffer=self.__memory.buf)
+        self.__buffers.fill(ord(renderer.background))
+        self.__executor = ProcessPoolExecutor(self.workers, initializer=_attach,
+                                              initargs=(renderer, self.__memory.name))
+        self.__pending = None
+        self.__buffer = 0
+
+    def __submit(self, step):
+        """Asks the workers to render a step into the next framebuffer."""
+        self.__buffer = 1 - self.__buffer
+        futures = [self.__executor.submit(_render_band, self.__buffer, step, band) for band in self.bands]
+        self.__pending = (step, self.__buffer, futures)
+
+    def render(self, step):
+        """Render a step of the renderer's shape across the workers.
+
+        Args:
+            step (int): The step of the shape to render.
+
+        Returns:
+            numpy.ndarray: A view of the shared framebuffer holding the frame. It is overwritten by the following
+                calls and invalid after close(), which unmaps the shared memory, so callers keeping the frame must
+                copy it first.
+        """
+        if self.__pending is None or self.__pending[0] != step:
+            self.__wait()
+            self.__submit(step)
+        _, buffer, _ = self.__pending
+        self.__wait()
+        if self.pipelined:
+            self.__submit(step + 1)
+        return self.__buffers[buffer]
+
+    def __wait(self):
+        """Waits for the pending frame, re-raising any error from the workers."""
+        if self.__pending is not None:
+            for future in self.__pending[2]:
+                future.result()
+            self.__pending = (self.__pending[0], self.__pending[1], [])
+
+    def close(self):
+        """Shut the workers down and release the shared memory.
+
+        Any view returned by render must be dropped or copied before calling close, as accessing it afterwards reads
+        unmapped memory.
+        """
+        self.__executor.shutdown(cancel_futures=True)
+        self.__buffers = None
+        self.__memory.close()
+        self.__memory.unlink()
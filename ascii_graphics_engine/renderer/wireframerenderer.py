@@ -1,4 +1,4 @@
-import time
+import numpy as np
 
 from .renderer import Renderer
 
@@ -11,7 +11,10 @@ class WireFrameRenderer(Renderer):
     Args:
         shape: The shape to be rendered.
         offset (int, optional): The offset value determining the screen size. Defaults to 10.
-        timeout (float, optional): The timeout time between shape rotations are rendered. Defaults to 0.05.
+        timeout (float, optional): The target time between rendered frames in seconds. Defaults to 0.05.
+        output (optional): The text stream frames are written to. Defaults to sys.stdout.
+        incremental (bool, optional): Draw in place writing only the changed cells. Defaults to False.
+        frame_skip (bool, optional): Skip drawing frames that run late. Defaults to False.
 
     Attributes:
         Inherits attributes from the Renderer class:
@@ -19,66 +22,62 @@ class WireFrameRenderer(Renderer):
             line (str): The character representing a line in the rendered wireframe.
 
     Methods:
-        __draw_line(point1, point2): Draws a line between two points on the screen.
-        __draw_point(*points): Draws a point on the screen.
+        __draw_lines(starts, ends): Draws a line between every pair of points on the screen at once.
+        __draw_points(x, y, character): Draws a character at every provided point on the screen.
         __wire_shape(): Draws the wireframe representation of the provided shape.
-        run(): Continuously rotates the shape and renders its wireframe representation on the screen.
+        _render(): Draws the wireframe representation of the shape into the screen pixels.
+        _cache_key(): Describes the rendering mode for frame cache keys.
 
     Note:
         This class provides functionality to render wireframe shapes by rotating and displaying them in ASCII art.
+        All edges are rasterized together as NumPy arrays and scattered into the screen with fancy indexing,
+        with the vertex points drawn last so they take priority over the lines.
     """
 
-    def __init__(self, shape, offset=10, timeout=0.05):
+    def __init__(self, shape, offset=10, timeout=0.05, output=None, incremental=False, frame_skip=False):
         self.point = "*"
         self.line = "."
-        self.timeout = timeout
-        super().__init__(shape, offset)
+        super().__init__(shape, offset, timeout, frame_skip, output, incremental)
 
-    def __draw_line(self, point1, point2):
-        x1, y1, *_ = point1
-        x2, y2, *_ = point2
-        x1, y1, x2, y2 = int(x1), int(y1), int(x2), int(y2)
-        dx = abs(x2 - x1)
-        dy = abs(y2 - y1)
-        if x1 < x2:
-            sx = 1
-        else:
-            sx = -1
-        if y1 < y2:
-            sy = 1
-        else:
-            sy = -1
-        error = dx - dy
-        while True:
-            if self.pixels[self.offset + x1][self.offset + y1] != self.point:
-                self.pixels[self.offset + x1][self.offset + y1] = self.line
-            if x1 == x2 and y1 == y2:
-                break
-            error_2 = 2 * error
-            if error_2 > -dy:
-                error -= dy
-                x1 += sx
-            if error_2 < dx:
-                error += dx
-                y1 += sy
+    def __draw_lines(self, starts, ends):
+        """Draws a Bresenham line between every pair of start and end points at once.
 
-    def __draw_point(self, *points):
-        """Draws a point on the screen based on the provided coordinates."""
-        x, y, *_ = points
-        self.pixels[self.offset + int(x)][self.offset + int(y)] = self.point
+        Each line is stepped along its major axis and the minor axis offset is the exact integer rounding
+        Bresenham's error term produces, so the lines match the incremental algorithm pixel for pixel.
+        """
+        x1, y1 = starts[:, 0], starts[:, 1]
+        x2, y2 = ends[:, 0], ends[:, 1]
+        dx = np.abs(x2 - x1)
+        dy = np.abs(y2 - y1)
+        lengths = np.maximum(dx, dy) + 1
+        line = np.repeat(np.arange(len(starts)), lengths)
+        step = np.arange(len(line)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        dx, dy = dx[line], dy[line]
+        x_major = dx >= dy
+        minor_x = -((dy - 2 * step * dx) // np.maximum(2 * dy, 1))
+        minor_y = -((dx - 2 * step * dy) // np.maximum(2 * dx, 1))
+        x = x1[line] + np.where(x1 < x2, 1, -1)[line] * np.where(x_major, step, minor_x)
+        y = y1[line] + np.where(y1 < y2, 1, -1)[line] * np.where(x_major, minor_y, step)
+        self.__draw_points(x, y, self.line)
+        if self.instrumentation is not None:
+            self.instrumentation.count("pixels_tested", len(line))
+
+    def __draw_points(self, x, y, character):
+        """Draws a character at every provided coordinate that lies within the rendered band of the screen."""
+        x, y = x + self.offset, y + self.offset
+        on_screen = (x >= self.band[0]) & (x < self.band[1]) & (y >= 0) & (y < self.pixels.shape[1])
+        self.pixels[x[on_screen], y[on_screen]] = ord(character)
 
     def __wire_shape(self):
         """Draws the wireframe representation of the shape."""
-        for x, y, z in self.shape.get_vertices():
-            self.__draw_point(x, y)
+        points = self._vertices()[:, :2].astype(np.intp)
+        self.__draw_lines(points[self.shape.edge_array[:, 0]], points[self.shape.edge_array[:, 1]])
+        self.__draw_points(points[:, 0], points[:, 1], self.point)
 
-        for edge in self.shape.get_edges():
-            self.__draw_line(self.shape.get_vertex(edge[0]), self.shape.get_vertex(edge[1]))
+    def _render(self):
+        """Draws the wireframe representation of the shape into the screen pixels."""
+        self.__wire_shape()
 
-    def run(self):
-        """Continuously rotates the shape and renders its wireframe representation on the screen."""
-        while True:
-            self.shape.rotate()
-            self.__wire_shape()
-            self._draw_screen()
-            time.sleep(self.timeout)
+    def _cache_key(self):
+        """Describes the rendering mode for frame cache keys, including the point and line characters."""
+        return super()._cache_key() + (self.point, self.line)
@@ -1,10 +1,22 @@
 import argparse
+import json
+import sys
 
+from .benchmark import Benchmark
+from .broadcastserver import BroadcastServer
+from .renderer.framecache import FrameCache
+from .renderer.instrumentation import Instrumentation
+from .renderer.resolutionscaler import ResolutionScaler
 from .renderer.solidfillrenderer import SolidFillRenderer
 from .renderer.wireframerenderer import WireFrameRenderer
-from .shapes.cube import Cube
-from .shapes.dodecahedron import Dodecahedron
-from .shapes.pyramid import Pyramid
+from .shapes.mesh import Mesh
+from .shapes.scene import Scene
+from .shapes.solids import SOLIDS
+from .sinks.asciicastsink import AsciicastSink
+from .sinks.deltasink import DeltaSink
+from .sinks.rawsink import RawSink
+
+SINKS = {"asciicast": AsciicastSink, "raw": RawSink, "delta": DeltaSink}
 
 
 def main():
@@ -14,43 +26,181 @@ def main():
 
     Usage:
         python runner.py [options]
+        python runner.py bench [bench options]
+        python runner.py [options] serve [serve options]
 
     Options:
         -h, --help          Show this help message and exit
         -r, --renderer      Select mode: (default: wire, fill)
-        -s, --solid         Select solid: (default: cube, pyramid, dodecahedron)
+        -s, --solid         Select one or more solids: (default: cube, pyramid, dodecahedron)
+        -c, --count         Show this many solids on a grid, repeating the selected solids
+        -m, --mesh          Show a mesh loaded from an OBJ or STL file instead of the solids
         -t, --timeout       Select timeout between frame renders in seconds: (default: 0.05)
         -S, --size          Select screen size in ascii chars: (default: 10)
+        -z, --z-buffer      Resolve filled surfaces per pixel with a depth buffer
+        --no-cull           Fill surfaces facing away from the viewer as well
+        -l, --shading       Shade filled surfaces by their angle to the light
+        -L, --light         Select the direction light arrives from as row, column and depth: (default: 1 -1 1)
+        -i, --incremental   Draw in place, writing only the cells that changed between frames
+        -f, --fps           Select a target frame rate, overriding the timeout
+        -n, --frames        Stop after rendering this many frames
+        -d, --duration      Stop after running for this many seconds
+        -k, --frame-skip    Skip drawing frames that run late to keep real-time pacing
+        -a, --adaptive      Rasterize at a reduced resolution while frames run over the timeout
+        -w, --workers       Render bands of rows on this many processes: (default: 0)
+        -p, --pipelined     With workers, render the next frame while the current one is drawn
+        -C, --cache         Cache finished frames within this many MiB: (default: 0, disabled)
+        -o, --output        Render headless into this file instead of the terminal
+        -F, --format        Select output file format: (default: asciicast, raw, delta)
+        -P, --profile       Show a status line with the rolling frame rate and stage breakdown
+        --profile-out       Write per-frame stage timings and counters to this JSON lines file on exit
+
+    Bench options:
+        -r, --renderers     Select renderers to benchmark: (default: wire, fill, fill-z, fill-shade)
+        -s, --solids        Select solids to benchmark: (default: cube, pyramid, dodecahedron)
+        -S, --sizes         Select screen sizes to benchmark: (default: 10 20 40)
+        -n, --frames        Select timed frames per run: (default: 100)
+        -o, --output        Write the JSON results to this file instead of stdout
+        --no-allocations    Skip the allocation tracing pass
+
+    Serve options:
+        -H, --host          Select the address to listen on: (default: 127.0.0.1)
+        -P, --port          Select the TCP port to listen on: (default: 2323)
     """
     parser = argparse.ArgumentParser(
         description='Simple game engine that offers a fun and interactive way to visualize different shapes using '
                     'ASCII characters')
     parser.add_argument('--renderer', '-r', type=str, default='wire', choices=['wire', 'fill'],
                         help='Select mode: (default: wire, fill)')
-    parser.add_argument('--solid', '-s', type=str, default='cube', choices=['cube', 'pyramid', 'dodecahedron'],
-                        help='Select solid: (default: cube, pyramid, dodecahedron)')
+    parser.add_argument('--solid', '-s', type=str, nargs='+', default=['cube'], choices=list(SOLIDS),
+                        help='Select one or more solids: (default: cube, pyramid, dodecahedron)')
+    parser.add_argument('--count', '-c', type=int, default=None,
+                        help='Show this many solids on a grid, repeating the selected solids')
+    parser.add_argument('--mesh', '-m', type=str, default=None,
+                        help='Show a mesh loaded from an OBJ or STL file instead of the solids')
     parser.add_argument('--timeout', '-t', type=float, default=0.05,
                         help='Select timeout: (default: 0.05)')
     parser.add_argument('--size', '-S', type=int, default=10,
                         help='Select screen size in ascii chars: (default: 10)')
+    parser.add_argument('--z-buffer', '-z', action='store_true',
+                        help='Resolve filled surfaces per pixel with a depth buffer instead of sorting them')
+    parser.add_argument('--no-cull', dest='cull', action='store_false',
+                        help='Fill surfaces facing away from the viewer as well')
+    parser.add_argument('--shading', '-l', action='store_true',
+                        help='Shade filled surfaces by their angle to the light')
+    parser.add_argument('--light', '-L', type=float, nargs=3, default=[1, -1, 1],
+                        help='Select the direction light arrives from as row, column and depth: (default: 1 -1 1)')
+    parser.add_argument('--incremental', '-i', action='store_true',
+                        help='Draw in place on the alternate screen, writing only the cells that changed')
+    parser.add_argument('--fps', '-f', type=float, default=None,
+                        help='Select a target frame rate, overriding the timeout')
+    parser.add_argument('--frames', '-n', type=int, default=None,
+                        help='Stop after rendering this many frames: (default: run forever)')
+    parser.add_argument('--duration', '-d', type=float, default=None,
+                        help='Stop after running for this many seconds: (default: run forever)')
+    parser.add_argument('--frame-skip', '-k', action='store_true',
+                        help='Skip drawing frames that run late to keep real-time pacing')
+    parser.add_argument('--adaptive', '-a', action='store_true',
+                        help='Rasterize at a reduced resolution while frames run over the timeout')
+    parser.add_argument('--workers', '-w', type=int, default=0,
+                        help='Render bands of rows on this many processes: (default: 0, render in this process)')
+    parser.add_argument('--pipelined', '-p', action='store_true',
+                        help='With workers, render the next frame while the current one is drawn')
+    parser.add_argument('--cache', '-C', type=float, default=0,
+                        help='Cache finished frames within this many MiB: (default: 0, disabled)')
+    parser.add_argument('--output', '-o', type=str, default=None,
+                        help='Render headless into this file instead of the terminal, requires --frames or --duration')
+    parser.add_argument('--format', '-F', type=str, default='asciicast', choices=list(SINKS),
+                        help='Select output file format: (default: asciicast, raw, delta)')
+    parser.add_argument('--profile', '-P', action='store_true',
+                        help='Show a status line with the rolling frame rate and stage breakdown')
+    parser.add_argument('--profile-out', type=str, default=None,
+                        help='Write per-frame stage timings and counters to this JSON lines file on exit')
+    subparsers = parser.add_subparsers(dest='command')
+    bench = subparsers.add_parser('bench', help='Benchmark renderers, solids and sizes and report JSON results')
+    bench.add_argument('--renderers', '-r', type=str, nargs='+', default=list(Benchmark.RENDERERS),
+                       choices=list(Benchmark.RENDERERS),
+                       help='Select renderers: (default: wire, fill, fill-z, fill-shade)')
+    bench.add_argument('--solids', '-s', type=str, nargs='+', default=list(SOLIDS),
+                       choices=list(SOLIDS), help='Select solids: (default: cube, pyramid, dodecahedron)')
+    bench.add_argument('--sizes', '-S', type=int, nargs='+', default=[10, 20, 40],
+                       help='Select screen sizes: (default: 10 20 40)')
+    bench.add_argument('--frames', '-n', type=int, default=100,
+                       help='Select timed frames per run: (default: 100)')
+    bench.add_argument('--output', '-o', type=str, default=None,
+                       help='Write the JSON results to this file instead of stdout')
+    bench.add_argument('--no-allocations', dest='allocations', action='store_false',
+                       help='Skip the allocation tracing pass')
+    serve = subparsers.add_parser('serve', help='Render once and stream the frames to any number of TCP clients')
+    serve.add_argument('--host', '-H', type=str, default='127.0.0.1',
+                       help='Select the address to listen on: (default: 127.0.0.1)')
+    serve.add_argument('--port', '-P', type=int, default=2323,
+                       help='Select the TCP port to listen on: (default: 2323)')
     args = parser.parse_args()
-    selected_solid = args.solid
+    if args.command == 'bench':
+        results = json.dumps(Benchmark(args.renderers, args.solids, args.sizes, args.frames,
+                                       allocations=args.allocations).run(), indent=2)
+        if args.output is None:
+            print(results)
+        else:
+            with open(args.output, "w") as file:
+                file.write(results + "\n")
+        return
+    if not any(args.light):
+        parser.error('--light must not be the zero vector')
+    if args.fps is not None and args.fps <= 0:
+        parser.error('--fps must be positive')
+    if args.count is not None and args.count < 1:
+        parser.error('--count must be at least 1')
+    if args.output is not None and args.frames is None and args.duration is None:
+        parser.error('--output requires --frames or --duration')
+    count = len(args.solid) if args.count is None else args.count
+    selected_solids = [SOLIDS[args.solid[k % len(args.solid)]] for k in range(count)]
     selected_renderer = args.renderer
     selected_size = args.size
-    timeout = args.timeout
+    timeout = args.timeout if args.fps is None else 1 / args.fps
+    if args.duration is not None and timeout <= 0 and (args.output is not None or args.command == 'serve'):
+        parser.error('--duration with --output or serve requires a positive --timeout or --fps')
 
-    if selected_solid == "pyramid":
-        solid = Pyramid(selected_size)
-    elif selected_solid == "dodecahedron":
-        solid = Dodecahedron(selected_size)
+    if args.mesh is not None:
+        solid = Mesh.load(args.mesh, selected_size)
+    elif len(selected_solids) == 1:
+        solid = selected_solids[0](selected_size)
     else:
-        solid = Cube(selected_size)
+        solid = Scene.grid(selected_solids, selected_size)
 
-    runner = WireFrameRenderer(solid, offset=selected_size, timeout=timeout)
+    runner = WireFrameRenderer(solid, offset=selected_size, timeout=timeout, incremental=args.incremental,
+                               frame_skip=args.frame_skip)
     if selected_renderer == "fill":
-        runner = SolidFillRenderer(solid, offset=selected_size, timeout=timeout)
+        runner = SolidFillRenderer(solid, offset=selected_size, timeout=timeout, z_buffer=args.z_buffer,
+                                   incremental=args.incremental, frame_skip=args.frame_skip, cull=args.cull,
+                                   shading=args.shading, light=args.light)
 
-    runner.run()
+    cache = FrameCache(int(args.cache * 1024 * 1024)) if args.cache > 0 else None
+    if args.adaptive:
+        runner.scaler = ResolutionScaler(timeout)
+    if args.profile or args.profile_out is not None:
+        runner.instrumentation = Instrumentation(overlay=args.profile)
+    server = BroadcastServer(runner, args.host, args.port) if args.command == 'serve' else None
+    try:
+        if server is not None:
+            server.run(frames=args.frames, duration=args.duration, workers=args.workers, pipelined=args.pipelined,
+                       cache=cache)
+        elif args.output is None:
+            runner.run(frames=args.frames, duration=args.duration, workers=args.workers, pipelined=args.pipelined,
+                       cache=cache)
+        else:
+            with SINKS[args.format](args.output, *runner.pixels.shape) as sink:
+                for timestamp, frame in runner.frames(frames=args.frames, duration=args.duration,
+                                                      workers=args.workers, pipelined=args.pipelined, cache=cache):
+                    sink.write(frame, timestamp)
+    finally:
+        if server is not None:
+            print(json.dumps(server.stats()), file=sys.stderr)
+        if cache is not None:
+            print(json.dumps(cache.stats()), file=sys.stderr)
+        if args.profile_out is not None:
+            runner.instrumentation.export(args.profile_out)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,148 @@
+import os
+import re
+
+import numpy as np
+from numpy import pi
+
+from .shape import Shape
+
+
+class Mesh(Shape):
+    """Represents a polygon mesh loaded from a Wavefront OBJ or STL file.
+
+        Inherits from the Shape class and builds the shape from arrays of vertices and faces, so meshes with tens
+        of thousands of faces are compiled without walking a tuple per surface.
+
+        Args:
+            vertices (numpy.ndarray): A (vertices, 3) array of the mesh's x, y and z coordinates.
+            faces (numpy.ndarray): A (faces, width) integer array of vertex loops wound counter-clockwise when
+                seen from outside, padded by repeating their first vertex.
+            size (float): The radius the mesh is scaled to.
+            angle (float, optional): The angle in radians for the mesh's orientation. Defaults to pi / 32.
+
+        Attributes:
+            Inherits attributes from the Shape class:
+                vertices (numpy.ndarray): An array containing the vertices of the mesh.
+                edges (numpy.ndarray): An (edges, 2) integer array of the unique edges of the faces.
+                angle (float): The angle (in radians) for the mesh's orientation.
+                surfaces (numpy.ndarray): A (faces, width) integer array of the faces as vertex loops.
+
+        Methods:
+            load(path: str, size: float, angle: float, cache: bool): Creates a mesh from an OBJ or STL file.
+            __read_obj(path: str): Parses the vertices and faces of a Wavefront OBJ file.
+            __read_stl(path: str): Parses the vertices and faces of a binary or ASCII STL file.
+            __weld(points: numpy.ndarray): Merges the repeated corners of STL triangles into shared vertices.
+
+        Note:
+            The mesh is centred on its bounding box and scaled so its furthest vertex lies at the given radius. The
+            file's y axis points up the screen and its z axis towards the viewer, so the x and y coordinates are
+            swapped into the engine's row and column order and the faces are reversed to keep them wound outwards.
+        """
+
+    def __init__(self, vertices, faces, size, angle=pi / 32):
+        vertices = np.array(vertices, dtype=float)[:, [1, 0, 2]]
+        vertices -= (vertices.min(axis=0) + vertices.max(axis=0)) / 2
+        vertices *= size / max(np.linalg.norm(vertices, axis=1).max(initial=0), 1e-12)
+        faces = np.array(faces, dtype=np.intp).reshape(len(faces), -1)
+        sizes = 1 + (faces[:, 1:] != faces[:, :1]).sum(axis=1)
+        position = np.arange(faces.shape[1])
+        faces = np.take_along_axis(faces, np.where((position > 0) & (position < sizes[:, None]),
+                                                   sizes[:, None] - position, position), axis=1)
+        starts, ends = faces.reshape(-1), np.roll(faces, -1, axis=1).reshape(-1)
+        keys = np.sort(np.minimum(starts, ends) * len(vertices) + np.maximum(starts, ends))
+        keys = keys[np.r_[True, keys[1:] != keys[:-1]]]
+        edges = np.stack((keys // len(vertices), keys % len(vertices)), axis=1)
+        edges = edges[edges[:, 0] != edges[:, 1]]
+        super().__init__(vertices, edges, angle, faces)
+
+    @classmethod
+    def load(cls, path, size, angle=pi / 32, cache=True):
+        """Create a mesh from a Wavefront OBJ or STL file.
+
+        The parsed vertices and faces are cached beside the file as an uncompressed .npz archive, which is reused
+        while it is newer than the file, so repeated startups skip parsing.
+
+        Args:
+            path (str): The path of the .obj or .stl file.
+            size (float): The radius the mesh is scaled to.
+            angle (float, optional): The angle in radians for the mesh's orientation. Defaults to pi / 32.
+            cache (bool, optional): Read and write the .npz cache. Defaults to True.
+
+        Returns:
+            Mesh: The loaded mesh.
+
+        Raises:
+            ValueError: If the file format is not supported or the file holds no faces.
+        """
+        readers = {".obj": cls.__read_obj, ".stl": cls.__read_stl}
+        extension = os.path.splitext(path)[1].lower()
+        if extension not in readers:
+            raise ValueError(f"Unsupported mesh format {extension!r}, expected one of {sorted(readers)}")
+        cached = path + ".npz"
+        if cache and os.path.exists(cached) and os.path.getmtime(cached) >= os.path.getmtime(path):
+            with np.load(cached) as archive:
+                vertices, faces = archive["vertices"], archive["faces"]
+        else:
+            vertices, faces = readers[extension](path)
+            if cache:
+                try:
+                    np.savez(cached, vertices=vertices, faces=faces)
+                except OSError:
+                    pass
+        if len(faces) == 0:
+            raise ValueError(f"{path} holds no faces")
+        return cls(vertices, faces, size, angle)
+
+    @staticmethod
+    def __read_obj(path):
+        """Parses the vertices and faces of a Wavefront OBJ file, ignoring texture coordinates and normals.
+
+        Returns:
+            tuple: A (vertices, 3) float array and a (faces, width) integer array of padded vertex loops.
+        """
+        vertices, faces = [], []
+        with open(path) as file:
+            for line in file:
+                if line.startswith("v "):
+                    vertices.append(line.split()[1:4])
+                elif line.startswith("f "):
+                    loop = [int(token.split("/")[0]) for token in line.split()[1:]]
+                    faces.append([index - 1 if index > 0 else len(vertices) + index for index in loop])
+        width = max((len(loop) for loop in faces), default=3)
+        faces = np.array([loop + loop[:1] * (width - len(loop)) for loop in faces], dtype=np.intp).reshape(-1, width)
+        return np.array(vertices, dtype=float).reshape(-1, 3), faces
+
+    @staticmethod
+    def __read_stl(path):
+        """Parses the vertices and faces of a binary or ASCII STL file.
+
+        Binary files are memory-mapped as an array of 50 byte triangle records, so the corners are read without
+        copying the file; ASCII files are recognised by their size not matching the triangle count.
+
+        Returns:
+            tuple: A (vertices, 3) float array and a (faces, 3) integer array of triangles.
+        """
+        with open(path, "rb") as file:
+            header = file.read(84)
+        count = int(np.frombuffer(header, dtype="<u4", count=1, offset=80)[0]) if len(header) == 84 else -1
+        if count > 0 and os.path.getsize(path) == 84 + 50 * count:
+            records = np.memmap(path, dtype=np.dtype([("normal", "<f4", 3), ("corners", "<f4", (3, 3)),
+                                                      ("attribute", "<u2")]), mode="r", offset=84, shape=(count,))
+            points = records["corners"].reshape(-1, 3)
+        else:
+            with open(path, "rb") as file:
+                points = np.array(re.findall(rb"vertex\s+(\S+)\s+(\S+)\s+(\S+)", file.read()), dtype=float)
+        return Mesh.__weld(points.reshape(-1, 3))
+
+    @staticmethod
+    def __weld(points):
+        """Merges the repeated corners of STL triangles into shared vertices.
+
+        Returns:
+            tuple: The unique vertices and a (faces, 3) integer array of triangles indexing them.
+        """
+        points = np.ascontiguousarray(points + 0.0)  # Adding zero turns -0.0 into 0.0 so both weld together.
+        rows = points.view(np.dtype((np.void, points.itemsize * 3))).reshape(-1)
+        unique, inverse = np.unique(rows, return_inverse=True)
+        vertices = unique.view(points.dtype).reshape(-1, 3).astype(float)
+        return vertices, inverse.reshape(-1, 3).astype(np.intp)
@@ -0,0 +1,160 @@
+import math
+
+import numpy as np
+
+from .shape import Shape
+
+
+class Scene(Shape):
+    """Represents many shapes rendered together as a single shape.
+
+    Inherits from the Shape class. The vertices of every shape are packed into one contiguous array and each
+    shape keeps its own rotation, phase and position, so a step transforms all of them with a single batched
+    matrix multiplication instead of one call per shape. Edges and surfaces are re-indexed into the packed
+    array, letting any renderer draw the whole scene into one screen with correct occlusion between shapes.
+    When any shape is array-backed, such as a Mesh, the surfaces of every shape are packed as vertex loops instead.
+
+    Args:
+        shapes (list): The shapes making up the scene.
+        positions (numpy.ndarray, optional): The translation of each shape. Defaults to the origin.
+        phases (list, optional): The step each shape starts from. Defaults to each shape's current step.
+
+    Attributes:
+        Inherits attributes from the Shape class:
+            shapes (list): The shapes making up the scene.
+            positions (numpy.ndarray): An array of shape (shapes, 3) holding the translation of each shape.
+            owners (numpy.ndarray): The index of the shape owning each packed vertex.
+            face_owners (numpy.ndarray): The index of the shape owning each surface.
+            transform (numpy.ndarray): An array of shape (shapes, 3, 3) holding each shape's current transform.
+
+    Methods:
+        grid(solids: list, size: float): Creates a scene laying solids out on a square grid.
+        vertices_at(step: int): Returns the packed vertices of the scene at a specific step.
+        poses(rotations: numpy.ndarray): Returns the vertices and normals of the scene turned as one rigid body for
+            a stack of orientations.
+        seek(step: int): Moves every shape in the scene to a specific step.
+        _step_rotations(): Returns the rotation applied by a single step to each shape.
+        _radii(): Returns the largest distance of a vertex from its shape's centre for each shape.
+
+    Note:
+        The shapes are copied into the scene when it is constructed; rotating the scene does not move the
+        original shape objects.
+    """
+
+    def __init__(self, shapes, positions=None, phases=None):
+        self.shapes = list(shapes)
+        self.positions = np.zeros((len(self.shapes), 3)) if positions is None else np.array(positions, dtype=float)
+        phases = [shape.step for shape in self.shapes] if phases is None else phases
+        self.owners = np.repeat(np.arange(len(self.shapes)), [len(shape.rest_vertices) for shape in self.shapes])
+        self.face_owners = np.repeat(np.arange(len(self.shapes)), [len(shape.surfaces) for shape in self.shapes])
+        self.__rotations = np.stack([shape.rotation_matrix(shape.angle) for shape in self.shapes])
+        self.__phases = np.stack([shape.orientation(phase) for shape, phase in zip(self.shapes, phases)])
+        starts = np.cumsum([0] + [len(shape.rest_vertices) for shape in self.shapes])
+        if any(isinstance(shape.surfaces, np.ndarray) for shape in self.shapes):
+            width = max(shape.face_loops.shape[1] for shape in self.shapes)
+            edges = np.concatenate([shape.edge_array + start for shape, start in zip(self.shapes, starts)])
+            surfaces = np.concatenate([np.hstack((loops, loops[:, :1].repeat(width - loops.shape[1], axis=1))) + start
+                                       for loops, start in zip((shape.face_loops for shape in self.shapes), starts)])
+        else:
+            edges = [(a + start, b + start) for shape, start in zip(self.shapes, starts) for a, b in shape.edges]
+            surfaces = [tuple((a + start, b + start) for a, b in surface)
+                        for shape, start in zip(self.shapes, starts) for surface in shape.surfaces]
+        vertices = np.concatenate([shape.rest_vertices for shape in self.shapes])
+        super().__init__(vertices, edges, 0.0, surfaces)
+
+    @classmethod
+    def grid(cls, solids, size):
+        """Create a scene laying solids out on a square grid that fills a screen.
+
+        Args:
+            solids (list): The Shape subclasses to place, each constructed with the size of a grid cell.
+            size (float): The half-width of the screen the grid fills.
+
+        Returns:
+            Scene: The scene with the solids positioned row by row, each starting from a different phase.
+
+        Raises:
+            ValueError: If no solids are given.
+        """
+        if not solids:
+            raise ValueError("a grid needs at least one solid")
+        columns = math.ceil(math.sqrt(len(solids)))
+        cell = 2 * size / columns
+        centres = -size + cell * (np.arange(columns) + 0.5)
+        positions = [(centres[k // columns], centres[k % columns], 0.0) for k in range(len(solids))]
+        shapes = [solid(max(cell / 2 - 0.5, 0.5)) for solid in solids]
+        return cls(shapes, positions, phases=[3 * k for k in range(len(solids))])
+
+    def orientation(self, step: int):
+        """Get the transform of every shape at a specific step.
+
+        Args:
+            step (int): The number of rotations to apply.
+
+        Returns:
+            numpy.ndarray: An array of shape (shapes, 3, 3) with the transform of each shape.
+        """
+        return self._orthonormalize(self.__phases @ np.linalg.matrix_power(self.__rotations, step))
+
+    def vertices_at(self, step: int):
+        """Get the packed vertices of the scene at a specific step without moving it.
+
+        Args:
+            step (int): The number of rotations to apply.
+
+        Returns:
+            numpy.ndarray: Vertices of every shape, translated to their positions.
+        """
+        return self.__place(self.orientation(step))
+
+    def poses(self, rotations):
+        """Get the vertices and surface normals of the scene for a stack of orientations at once.
+
+        Each orientation turns the whole scene about the origin as one rigid body, with every shape at its
+        starting phase and position.
+
+        Args:
+            rotations (numpy.ndarray): An array of shape (N, 3, 3) of orientations to multiply the scene by.
+
+        Returns:
+            tuple: The vertices, of shape (N, vertices, 3), and surface normals, of shape (N, surfaces, 3).
+        """
+        transform = self.orientation(0)
+        normals = np.einsum("fi,fij->fj", self.rest_normals, transform[self.face_owners])
+        return self.__place(transform) @ rotations, normals @ rotations
+
+    def seek(self, step: int):
+        """Move every shape in the scene to a specific step, rotating the surface normals alongside the vertices.
+
+        Args:
+            step (int): The number of rotations to apply to the rest pose.
+
+        Returns:
+            numpy.ndarray: Updated packed vertices at that step.
+        """
+        self.step = step
+        self.transform = self.orientation(step)
+        self.vertices = self.__place(self.transform)
+        self.normals = np.einsum("fi,fij->fj", self.rest_normals, self.transform[self.face_owners])
+        return self.vertices
+
+    def _step_rotations(self):
+        """Get the rotation applied by a single step to each shape in the scene.
+
+        Returns:
+            numpy.ndarray: An array of shape (shapes, 3, 3).
+        """
+        return self.__rotations
+
+    def _radii(self):
+        """Get the largest distance of a vertex from its shape's centre for each shape in the scene.
+
+        Returns:
+            numpy.ndarray: An array of shape (shapes,).
+        """
+        return np.array([shape._radii().max() for shape in self.shapes])
+
+    def __place(self, transform):
+        """Transforms every packed vertex by its owner's transform in one batched multiplication."""
+        rotated = np.einsum("vi,vij->vj", self.rest_vertices, transform[self.owners])
+        return rotated + self.positions[self.owners]
@@ -1,21 +1,58 @@
+import hashlib
+
 import numpy as np
 
 
 class Shape:
     """Represents a geometric shape with vertices and edges.
 
+    The vertices provided at construction are kept as an immutable rest pose. Rotating the shape only advances
+    a step counter; the transform for a step is computed from the rest pose directly, so floating-point error
+    does not accumulate across frames and any frame can be computed out of order.
+
+    The topology is compiled once at construction: the edges into an integer array, and every surface into an
+    ordered loop of vertex indices wound outwards, with its rest-pose normal. Renderers gather coordinates
+    through these arrays with a single fancy-index operation instead of walking the surface tuples each frame.
+
     Args:
         vertices (numpy.ndarray): An array containing the vertices of the shape.
-        edges (list): A list of edges connecting the vertices.
+        edges (list): A list of edges connecting the vertices, or an (edges, 2) integer array.
         angle (float): The angle (in radians) for rotating the shape.
-        surfaces (list): A list of surfaces that are described by a tuple of vertices
+        surfaces (list): A list of surfaces that are described by a tuple of vertices, or a (surfaces, width)
+            integer array of vertex loops wound outwards and padded by repeating their first vertex.
 
     Attributes:
-        vertices (numpy.ndarray): An array containing the vertices of the shape.
-        edges (list): A list of edges connecting the vertices.
+        rest_vertices (numpy.ndarray): A read-only array containing the vertices of the shape before rotation.
+        vertices (numpy.ndarray): An array containing the vertices of the shape at the current step.
+        edges (list): A list of edges connecting the vertices, or an (edges, 2) integer array.
         angle (float): The angle (in radians) for rotating the shape.
+        step (int): The number of rotations applied to the rest pose.
+        transform (numpy.ndarray): The 3x3 matrix taking the rest pose to the current step.
+        normals (numpy.ndarray): A (surfaces, 3) array of the outward unit normal of every surface at the current
+            step.
+        edge_array (numpy.ndarray): An (edges, 2) integer array of the vertex indices of every edge.
+        surface_edges (numpy.ndarray): A (surfaces, width, 2) integer array of the edges of every surface as
+            listed in surfaces, padded with degenerate edges.
+        face_loops (numpy.ndarray): A (surfaces, width) integer array holding the vertex indices of every surface
+            in outward winding order, padded by repeating the first vertex.
+        face_sizes (numpy.ndarray): The number of vertices in every surface.
+        rest_normals (numpy.ndarray): A (surfaces, 3) array of the outward unit normal of every surface before
+            rotation.
 
     Methods:
+        __compile_topology(): Builds the edge, surface and normal arrays from the edges and surfaces.
+        __compile_face_tuples(): Builds the surface arrays from surfaces given as tuples of edges.
+        __compile_face_array(): Builds the surface arrays from surfaces given as an array of vertex loops.
+        rotation_matrix(angle: float): Returns the rotation applied by a single step.
+        orientation(step: int): Returns the transform for a specific step.
+        _orthonormalize(matrices: numpy.ndarray): Returns the nearest rotation to each matrix.
+        vertices_at(step: int): Returns the vertices of the shape at a specific step.
+        poses(rotations: numpy.ndarray): Returns the vertices and normals for a stack of orientations at once.
+        period(tolerance: float, limit: int): Returns the number of steps after which the rotation repeats.
+        fingerprint(): Returns a digest identifying the geometry and motion of the shape.
+        _step_rotations(): Returns the rotation applied by a single step to each rigid part.
+        _radii(): Returns the largest distance of a vertex from the rotation centre for each rigid part.
+        seek(step: int): Moves the shape to a specific step.
         rotate(): Rotates the shape around its center based on the provided angle.
         get_vertices(): Returns the vertices of the shape.
         get_vertex(vertex: int): Returns the specific vertex of the shape.
@@ -26,40 +63,235 @@ class Shape:
     """
 
     def __init__(self, vertices, edges, angle, surfaces):
-        self.vertices = vertices
+        self.rest_vertices = np.array(vertices, dtype=float)
+        self.rest_vertices.setflags(write=False)
         self.edges = edges
         self.angle = angle
         self.surfaces = surfaces
+        self.__compile_topology()
+        self.__rotation = self.rotation_matrix(angle)
+        self.__periods = {}
+        self.__fingerprint = None
+        self.seek(0)
 
-    def rotate(self):
-        """Rotate the shape around its center based on the stored angle.
+    def __compile_topology(self):
+        """Builds the edge, surface and normal arrays from the edges and surfaces."""
+        self.edge_array = np.array(self.edges, dtype=np.intp).reshape(-1, 2)
+        if isinstance(self.surfaces, np.ndarray):
+            self.__compile_face_array()
+        else:
+            self.__compile_face_tuples()
+        corners = self.rest_vertices[self.face_loops]
+        following = self.rest_vertices[np.roll(self.face_loops, -1, axis=1)]
+        normals = np.cross(corners, following).sum(axis=1)
+        if not isinstance(self.surfaces, np.ndarray):
+            centres = corners.sum(axis=1) / np.maximum(self.face_sizes, 1)[:, None]
+            inward = np.einsum("ij,ij->i", normals, centres - self.rest_vertices.mean(axis=0)) < 0
+            position = np.arange(self.face_loops.shape[1])
+            reverse = np.where((position > 0) & (position < self.face_sizes[:, None]),
+                               self.face_sizes[:, None] - position, position)
+            self.face_loops[inward] = np.take_along_axis(self.face_loops, reverse, axis=1)[inward]
+            normals[inward] *= -1
+        lengths = np.linalg.norm(normals, axis=1)
+        self.rest_normals = normals / np.where(lengths > 0, lengths, 1)[:, None]
+        for array in (self.edge_array, self.surface_edges, self.face_loops, self.face_sizes, self.rest_normals):
+            array.setflags(write=False)
 
-        The shape is rotated using 3D rotation matrices along x, y, and z axes.
+    def __compile_face_tuples(self):
+        """Builds the surface arrays from surfaces given as tuples of edges, ordering each into a vertex loop."""
+        width = max((len(surface) for surface in self.surfaces), default=0)
+        self.surface_edges = np.zeros((len(self.surfaces), width, 2), dtype=np.intp)
+        self.face_loops = np.zeros((len(self.surfaces), width), dtype=np.intp)
+        self.face_sizes = np.array([len(surface) for surface in self.surfaces], dtype=np.intp)
+        for k, surface in enumerate(self.surfaces):
+            self.surface_edges[k, :len(surface)] = surface
+            self.surface_edges[k, len(surface):] = surface[0][0]
+            neighbours = {}
+            for a, b in surface:
+                neighbours.setdefault(a, []).append(b)
+                neighbours.setdefault(b, []).append(a)
+            loop = [surface[0][0], surface[0][1]]
+            while len(loop) < len(surface):
+                loop.append(next(vertex for vertex in neighbours[loop[-1]] if vertex != loop[-2]))
+            self.face_loops[k, :len(loop)] = loop
+            self.face_loops[k, len(loop):] = loop[0]
+
+    def __compile_face_array(self):
+        """Builds the surface arrays from surfaces given as an array of vertex loops without a Python loop.
+
+        The loops are taken to be padded by repeating their first vertex and already wound outwards, as mesh
+        formats store them; a non-convex mesh cannot be rewound from its centre the way tuple surfaces are.
+        """
+        self.face_loops = np.array(self.surfaces, dtype=np.intp).reshape(len(self.surfaces), -1)
+        self.face_sizes = 1 + (self.face_loops[:, 1:] != self.face_loops[:, :1]).sum(axis=1)
+        self.surface_edges = np.stack((self.face_loops, np.roll(self.face_loops, -1, axis=1)), axis=2)
+
+    @staticmethod
+    def rotation_matrix(angle):
+        """Get the rotation applied by a single step.
+
+        The step rotates about the x, y and z axes in turn by the provided angle.
+
+        Args:
+            angle (float): The angle (in radians) rotated about each axis.
 
         Returns:
-            numpy.ndarray: Updated vertices after rotation.
+            numpy.ndarray: The 3x3 matrix to multiply row vectors by.
         """
         rx = np.array([
             [1, 0, 0],
-            [0, np.cos(self.angle), -np.sin(self.angle)],
-            [0, np.sin(self.angle), np.cos(self.angle)]
+            [0, np.cos(angle), -np.sin(angle)],
+            [0, np.sin(angle), np.cos(angle)]
         ])
         ry = np.array([
-            [np.cos(self.angle), 0, np.sin(self.angle)],
+            [np.cos(angle), 0, np.sin(angle)],
             [0, 1, 0],
-            [-np.sin(self.angle), 0, np.cos(self.angle)]
+            [-np.sin(angle), 0, np.cos(angle)]
         ])
 
         rz = np.array([
-            [np.cos(self.angle), -np.sin(self.angle), 0],
-            [np.sin(self.angle), np.cos(self.angle), 0],
+            [np.cos(angle), -np.sin(angle), 0],
+            [np.sin(angle), np.cos(angle), 0],
             [0, 0, 1]
         ])
-        self.vertices = np.dot(self.vertices, rx)
-        self.vertices = np.dot(self.vertices, ry)
-        self.vertices = np.dot(self.vertices, rz)
+        return rx @ ry @ rz
+
+    def orientation(self, step: int):
+        """Get the transform taking the rest pose to a specific step.
+
+        The step rotation is raised to the power of the step by repeated squaring. Rounding leaves the power
+        slightly non-orthogonal, by an amount that grows linearly with the step, which would shear and scale the
+        shape over a long run, so the power is projected back onto the nearest rotation. Only the angle keeps a
+        rounding error growing with the step, which shifts the animation's phase without distorting the shape.
+
+        Args:
+            step (int): The number of rotations to apply.
+
+        Returns:
+            numpy.ndarray: The 3x3 matrix to multiply the rest pose by.
+        """
+        return self._orthonormalize(np.linalg.matrix_power(self.__rotation, step))
+
+    @staticmethod
+    def _orthonormalize(matrices):
+        """Get the nearest rotation to each matrix, removing accumulated scale and shear.
+
+        Args:
+            matrices (numpy.ndarray): An array of shape (..., 3, 3) of nearly orthogonal matrices.
+
+        Returns:
+            numpy.ndarray: The orthogonal factor of the polar decomposition of each matrix.
+        """
+        u, _, vt = np.linalg.svd(matrices)
+        return u @ vt
+
+    def vertices_at(self, step: int):
+        """Get the vertices of the shape at a specific step without moving the shape.
+
+        Args:
+            step (int): The number of rotations to apply.
+
+        Returns:
+            numpy.ndarray: Vertices of the shape at that step.
+        """
+        return self.rest_vertices @ self.orientation(step)
+
+    def poses(self, rotations):
+        """Get the vertices and surface normals of the shape for a stack of orientations at once.
+
+        Every orientation is applied to the rest pose in a single batched matrix multiplication, without moving
+        the shape.
+
+        Args:
+            rotations (numpy.ndarray): An array of shape (N, 3, 3) of orientations to multiply the rest pose by.
+
+        Returns:
+            tuple: The vertices, of shape (N, vertices, 3), and surface normals, of shape (N, surfaces, 3).
+        """
+        return self.rest_vertices @ rotations, self.rest_normals @ rotations
+
+    def _step_rotations(self):
+        """Get the rotation applied by a single step to each rigid part of the shape.
+
+        Returns:
+            numpy.ndarray: An array of shape (parts, 3, 3).
+        """
+        return self.__rotation[None]
+
+    def _radii(self):
+        """Get the largest distance of a vertex from the rotation centre for each rigid part of the shape.
+
+        Returns:
+            numpy.ndarray: An array of shape (parts,).
+        """
+        return np.linalg.norm(self.rest_vertices, axis=1).max(initial=0)[None]
+
+    def period(self, tolerance=0.05, limit=4096):
+        """Get the number of steps after which the rotation repeats, or nearly repeats.
+
+        A step count qualifies once no vertex can be displaced from its starting position by more than the
+        tolerance, measured in screen characters. The displacement is bounded by the part's radius times the
+        Frobenius norm of the accumulated rotation minus the identity. The result is cached per tolerance and
+        limit.
+
+        Args:
+            tolerance (float, optional): The largest vertex displacement accepted as a repeat. Defaults to 0.05.
+            limit (int, optional): The largest step count searched. Defaults to 4096.
+
+        Returns:
+            int: The period in steps, or None if the rotation does not repeat within the limit.
+        """
+        if (tolerance, limit) not in self.__periods:
+            rotations, parts = np.unique(self._step_rotations(), axis=0, return_inverse=True)
+            radii = np.zeros(len(rotations))
+            np.maximum.at(radii, parts.reshape(-1), self._radii())
+            powers = np.empty((limit,) + rotations.shape)
+            powers[0] = rotations
+            for k in range(1, limit):
+                powers[k] = powers[k - 1] @ rotations
+            drift = np.sqrt(((powers - np.eye(3)) ** 2).sum(axis=(-2, -1))) * radii
+            repeats = np.flatnonzero(drift.max(axis=1) <= tolerance)
+            self.__periods[tolerance, limit] = int(repeats[0]) + 1 if len(repeats) else None
+        return self.__periods[tolerance, limit]
+
+    def fingerprint(self):
+        """Get a digest identifying the geometry and motion of the shape, independent of its current step.
+
+        Returns:
+            str: A hexadecimal digest of the starting vertices, step rotations and topology.
+        """
+        if self.__fingerprint is None:
+            digest = hashlib.sha1()
+            for array in (self.vertices_at(0), self._step_rotations(), self.edge_array, self.surface_edges):
+                digest.update(np.ascontiguousarray(array).tobytes())
+            self.__fingerprint = digest.hexdigest()
+        return self.__fingerprint
+
+    def seek(self, step: int):
+        """Move the shape to a specific step, rotating the surface normals alongside the vertices.
+
+        Args:
+            step (int): The number of rotations to apply to the rest pose.
+
+        Returns:
+            numpy.ndarray: Updated vertices at that step.
+        """
+        self.step = step
+        self.transform = self.orientation(step)
+        self.vertices = self.rest_vertices @ self.transform
+        self.normals = self.rest_normals @ self.transform
         return self.vertices
 
+    def rotate(self):
+        """Rotate the shape around its center based on the stored angle.
+
+        The shape is rotated using 3D rotation matrices along x, y, and z axes.
+
+        Returns:
+            numpy.ndarray: Updated vertices after rotation.
+        """
+        return self.seek(self.step + 1)
+
     def get_vertices(self):
         """Get the vertices of the shape.
 
@@ -0,0 +1,5 @@
+from .cube import Cube
+from .dodecahedron import Dodecahedron
+from .pyramid import Pyramid
+
+SOLIDS = {"cube": Cube, "pyramid": Pyramid, "dodecahedron": Dodecahedron}
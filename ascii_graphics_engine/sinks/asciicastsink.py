@@ -0,0 +1,43 @@
+import json
+import time
+
+from ..renderer.terminaldiff import TerminalDiff
+from .sink import Sink
+
+
+class AsciicastSink(Sink):
+    """Writes frames as an asciicast v2 recording that can be replayed with asciinema.
+
+    Inherits from the Sink class. Every frame becomes one output event holding only the cells that changed
+    since the previous frame, encoded with ANSI cursor-move sequences.
+
+    Args:
+        path (str): The path of the file to write.
+        rows (int): The number of rows in a frame.
+        columns (int): The number of columns in a frame.
+        buffer_size (int, optional): The size of the write buffer in bytes. Defaults to 1 MiB.
+        title (str, optional): The title stored in the recording header. Defaults to None.
+
+    Methods:
+        _header(): Returns the asciicast header line.
+        _encode(frame, timestamp): Returns the output event drawing the changed cells.
+    """
+
+    def __init__(self, path, rows, columns, buffer_size=1024 * 1024, title=None):
+        self.__title = title
+        self.__terminal = TerminalDiff(rows, columns)
+        super().__init__(path, rows, columns, buffer_size)
+
+    def _header(self):
+        """Returns the asciicast header line."""
+        header = {"version": 2, "width": self.columns, "height": self.rows, "timestamp": int(time.time())}
+        if self.__title is not None:
+            header["title"] = self.__title
+        return (json.dumps(header) + "\n").encode()
+
+    def _encode(self, frame, timestamp):
+        """Returns the output event drawing the cells that changed since the previous frame."""
+        data = self.__terminal.update(frame)
+        if self.frames == 0:
+            data = "\x1b[?25l\x1b[2J" + data
+        return (json.dumps([round(timestamp, 6), "o", data]) + "\n").encode()
@@ -0,0 +1,87 @@
+import struct
+
+import numpy as np
+
+from .sink import Sink
+
+
+class DeltaSink(Sink):
+    """Writes frames in a compact binary format storing only the runs of cells that changed.
+
+    Inherits from the Sink class. The file starts with the magic bytes b"AGEDELTA" followed by the rows and
+    columns as little-endian uint16. Every frame is stored as its float64 timestamp, a uint32 run count, the
+    uint32 flat start index and uint32 length of every run, and then the characters of all runs back to back.
+    The first frame is compared against a blank frame of zero bytes, so it is stored in full.
+
+    Args:
+        path (str): The path of the file to write.
+        rows (int): The number of rows in a frame.
+        columns (int): The number of columns in a frame.
+        buffer_size (int, optional): The size of the write buffer in bytes. Defaults to 1 MiB.
+        gap (int, optional): Runs separated by at most this many unchanged cells are merged, as storing them
+            is cheaper than another run header. Defaults to 8.
+
+    Methods:
+        _header(): Returns the magic bytes and frame size.
+        _encode(frame, timestamp): Returns the runs of cells that changed since the previous frame.
+        decode(path): Yields the timestamp and frame of every frame in a file.
+    """
+
+    magic = b"AGEDELTA"
+
+    def __init__(self, path, rows, columns, buffer_size=1024 * 1024, gap=8):
+        self.__gap = gap
+        self.__previous = np.zeros(rows * columns, dtype=np.uint8)
+        super().__init__(path, rows, columns, buffer_size)
+
+    def _header(self):
+        """Returns the magic bytes and frame size."""
+        return self.magic + struct.pack("<HH", self.rows, self.columns)
+
+    def _encode(self, frame, timestamp):
+        """Returns the runs of cells that changed since the previous frame."""
+        frame = frame.reshape(-1)
+        changed = frame != self.__previous
+        edges = np.diff(changed.astype(np.int8), prepend=0, append=0)
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        if len(starts) > 1:
+            merge = starts[1:] - ends[:-1] <= self.__gap
+            starts, ends = starts[np.concatenate(([True], ~merge))], ends[np.concatenate((~merge, [True]))]
+        covered = np.zeros(len(frame) + 1, dtype=np.int8)
+        np.add.at(covered, starts, 1)
+        np.add.at(covered, ends, -1)
+        payload = frame[np.cumsum(covered[:-1]) > 0]
+        self.__previous[...] = frame
+        return b"".join((struct.pack("<dI", timestamp, len(starts)), starts.astype("<u4").tobytes(),
+                         (ends - starts).astype("<u4").tobytes(), payload.tobytes()))
+
+    @classmethod
+    def decode(cls, path):
+        """Read back a file written by a DeltaSink.
+
+        Args:
+            path (str): The path of the file to read.
+
+        Yields:
+            tuple: The timestamp and a 2D uint8 array of character codes of every frame, top row first.
+        """
+        with open(path, "rb") as file:
+            data = file.read()
+        if data[:len(cls.magic)] != cls.magic:
+            raise ValueError(f"{path} is not a delta frame file")
+        rows, columns = struct.unpack_from("<HH", data, len(cls.magic))
+        position = len(cls.magic) + 4
+        frame = np.zeros(rows * columns, dtype=np.uint8)
+        while position < len(data):
+            timestamp, runs = struct.unpack_from("<dI", data, position)
+            position += 12
+            starts = np.frombuffer(data, dtype="<u4", count=runs, offset=position).astype(np.intp)
+            lengths = np.frombuffer(data, dtype="<u4", count=runs, offset=position + 4 * runs).astype(np.intp)
+            position += 8 * runs
+            size = int(lengths.sum())
+            payload = np.frombuffer(data, dtype=np.uint8, count=size, offset=position)
+            position += size
+            offsets = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+            frame[np.arange(size) + offsets] = payload
+            yield timestamp, frame.reshape(rows, columns).copy()
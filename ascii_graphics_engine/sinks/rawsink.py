@@ -0,0 +1,30 @@
+import numpy as np
+
+from .sink import Sink
+
+
+class RawSink(Sink):
+    """Writes frames as plain text, concatenated one after another.
+
+    Inherits from the Sink class. Every frame is rows lines of columns characters each terminated by a newline,
+    so frame k starts at byte k * rows * (columns + 1).
+
+    Args:
+        path (str): The path of the file to write.
+        rows (int): The number of rows in a frame.
+        columns (int): The number of columns in a frame.
+        buffer_size (int, optional): The size of the write buffer in bytes. Defaults to 1 MiB.
+
+    Methods:
+        _encode(frame, timestamp): Joins the rows of a frame into newline-terminated text.
+    """
+
+    def __init__(self, path, rows, columns, buffer_size=1024 * 1024):
+        self.__text = np.empty((rows, columns + 1), dtype=np.uint8)
+        self.__text[:, -1] = ord("\n")
+        super().__init__(path, rows, columns, buffer_size)
+
+    def _encode(self, frame, timestamp):
+        """Joins the rows of a frame into newline-terminated text."""
+        self.__text[:, :-1] = frame
+        return self.__text.tobytes()
@@ -0,0 +1,77 @@
+from abc import ABC, abstractmethod
+
+
+class Sink(ABC):
+    """Abstract base class for writing rendered frames to a file.
+
+    Frames are streamed into the sink one at a time. The file is opened with a large buffer so frames are
+    written to disk in bulk rather than once per frame.
+
+    Args:
+        path (str): The path of the file to write.
+        rows (int): The number of rows in a frame.
+        columns (int): The number of columns in a frame.
+        buffer_size (int, optional): The size of the write buffer in bytes. Defaults to 1 MiB.
+
+    Attributes:
+        path (str): The path of the file to write.
+        rows (int): The number of rows in a frame.
+        columns (int): The number of columns in a frame.
+        frames (int): The number of frames written so far.
+
+    Methods:
+        _header(): Returns the bytes written before the first frame.
+        _encode(frame, timestamp): Abstract method encoding a frame into bytes.
+        write(frame, timestamp): Encodes and writes a frame.
+        close(): Flushes and closes the file.
+    """
+
+    def __init__(self, path, rows, columns, buffer_size=1024 * 1024):
+        self.path = path
+        self.rows = rows
+        self.columns = columns
+        self.frames = 0
+        self.__file = open(path, "wb", buffering=buffer_size)
+        self.__file.write(self._header())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _header(self):
+        """Get the bytes written before the first frame.
+
+        Returns:
+            bytes: The file header, empty by default.
+        """
+        return b""
+
+    @abstractmethod
+    def _encode(self, frame, timestamp):
+        """Encode a frame into the bytes to append to the file.
+
+        Args:
+            frame (numpy.ndarray): A 2D uint8 array of character codes, top row first.
+            timestamp (float): The time of the frame in seconds from the start of the animation.
+
+        Returns:
+            bytes: The encoded frame.
+        """
+        pass
+
+    def write(self, frame, timestamp):
+        """Encode and write a frame.
+
+        Args:
+            frame (numpy.ndarray): A 2D uint8 array of character codes, top row first.
+            timestamp (float): The time of the frame in seconds from the start of the animation.
+        """
+        self.__file.write(self._encode(frame, timestamp))
+        self.frames += 1
+
+    def close(self):
+        """Flush and close the file."""
+        if not self.__file.closed:
+            self.__file.close()
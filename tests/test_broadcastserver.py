@@ -0,0 +1,49 @@
+import asyncio
+import socket
+import threading
+
+from ascii_graphics_engine.broadcastserver import BroadcastServer
+from ascii_graphics_engine.renderer.solidfillrenderer import SolidFillRenderer
+from ascii_graphics_engine.shapes.cube import Cube
+
+
+class GatedRenderer(SolidFillRenderer):
+    """Holds back the first frame until the test's clients are connected."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.gate = threading.Event()
+
+    def frames(self, *args, **kwargs):
+        self.gate.wait(10)
+        yield from super().frames(*args, **kwargs)
+
+
+async def _broadcast(server, frames):
+    serving = asyncio.create_task(server.serve(frames=frames))
+    while server.port == 0:
+        await asyncio.sleep(0.01)
+    reader, _ = await asyncio.open_connection(server.host, server.port)
+    stalled = socket.socket()
+    stalled.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+    stalled.connect((server.host, server.port))
+    while server.stats()["clients"] < 2:
+        await asyncio.sleep(0.01)
+    server.renderer.gate.set()
+    received = await reader.read()
+    await serving
+    stalled.close()
+    return received
+
+
+def test_slow_client_drops_frames_without_holding_up_the_others():
+    # Frames of about 40 KB, so the stalled client backs up once the kernel's socket buffers are full.
+    frames = 200
+    renderer = GatedRenderer(Cube(75), offset=100, timeout=0.005)
+    server = BroadcastServer(renderer, port=0)
+    server.LINGER = 0.1
+    received = asyncio.run(_broadcast(server, frames))
+    stats = server.stats()
+    assert stats["frames"] == frames
+    assert received.count(BroadcastServer.HOME) == frames
+    assert stats["dropped"] > 0
@@ -0,0 +1,20 @@
+import numpy as np
+
+from ascii_graphics_engine.renderer.solidfillrenderer import SolidFillRenderer
+from ascii_graphics_engine.shapes.cube import Cube
+from ascii_graphics_engine.sinks.deltasink import DeltaSink
+
+
+def test_decode_reads_back_what_was_written(tmp_path):
+    path = str(tmp_path / "frames.delta")
+    renderer = SolidFillRenderer(Cube(5), offset=6)
+    written = []
+    with DeltaSink(path, *renderer.pixels.shape) as sink:
+        for timestamp, frame in renderer.frames(frames=10):
+            sink.write(frame, timestamp)
+            written.append((timestamp, frame.copy()))
+    decoded = list(DeltaSink.decode(path))
+    assert len(decoded) == len(written)
+    for (timestamp, frame), (expected_timestamp, expected) in zip(decoded, written):
+        assert timestamp == expected_timestamp
+        assert np.array_equal(frame, expected)
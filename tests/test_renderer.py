@@ -0,0 +1,41 @@
+import io
+
+import numpy as np
+import pytest
+
+from ascii_graphics_engine.renderer.instrumentation import Instrumentation
+from ascii_graphics_engine.renderer.solidfillrenderer import SolidFillRenderer
+from ascii_graphics_engine.shapes.cube import Cube
+
+
+def test_frame_readable_after_pooled_generator_finishes():
+    renderer = SolidFillRenderer(Cube(5), offset=6)
+    for _, frame in renderer.frames(frames=3, workers=2):
+        last = frame
+    assert len(bytes(last[0])) == renderer.pixels.shape[1]
+    frames = list(renderer.frames(frames=3, workers=2, pipelined=True))
+    assert all(len(bytes(frame[0])) == renderer.pixels.shape[1] for _, frame in frames)
+
+
+def test_pooled_frames_match_frames_rendered_in_process():
+    expected = [frame.copy() for _, frame in SolidFillRenderer(Cube(5), offset=6).frames(frames=5)]
+    pooled = [frame.copy() for _, frame in SolidFillRenderer(Cube(5), offset=6).frames(frames=5, workers=2)]
+    assert all(np.array_equal(a, b) for a, b in zip(expected, pooled))
+
+
+def test_run_and_frames_record_the_same_stages():
+    for drive in (lambda renderer: renderer.run(frames=4), lambda renderer: list(renderer.frames(frames=4))):
+        renderer = SolidFillRenderer(Cube(5), offset=6, timeout=0, output=io.StringIO())
+        renderer.instrumentation = Instrumentation()
+        drive(renderer)
+        records = renderer.instrumentation.records()
+        assert len(records) == 4
+        assert (records["transform"] > 0).all() and (records["rasterize"] > 0).all()
+
+
+@pytest.mark.parametrize("timeout", [0, -0.05])
+def test_frames_rejects_duration_without_positive_timeout(timeout):
+    renderer = SolidFillRenderer(Cube(5), offset=6, timeout=timeout)
+    with pytest.raises(ValueError, match="timeout"):
+        next(renderer.frames(duration=1))
+    assert len(list(renderer.frames(frames=2))) == 2
@@ -0,0 +1,19 @@
+import numpy as np
+import pytest
+
+from ascii_graphics_engine.shapes.cube import Cube
+from ascii_graphics_engine.shapes.pyramid import Pyramid
+from ascii_graphics_engine.shapes.scene import Scene
+
+
+def test_orientation_stays_orthonormal_over_long_runs():
+    for step in (10 ** 3, 10 ** 6, 10 ** 9, 10 ** 12):
+        transform = Cube(5).orientation(step)
+        assert np.allclose(transform @ transform.T, np.eye(3), atol=1e-12)
+        transforms = Scene.grid([Cube, Pyramid], 10).orientation(step)
+        assert np.allclose(transforms @ transforms.transpose(0, 2, 1), np.eye(3), atol=1e-12)
+
+
+def test_empty_grid_is_rejected():
+    with pytest.raises(ValueError, match="at least one solid"):
+        Scene.grid([], 10)
@@ -0,0 +1,15 @@
+import pytest
+
+from ascii_graphics_engine.renderer.solidfillrenderer import SolidFillRenderer
+from ascii_graphics_engine.shapes.cube import Cube
+
+
+def test_zero_light_is_rejected():
+    with pytest.raises(ValueError, match="light"):
+        SolidFillRenderer(Cube(5), offset=6, shading=True, light=(0, 0, 0))
+
+
+def test_shading_uses_the_ramp():
+    renderer = SolidFillRenderer(Cube(5), offset=6, shading=True)
+    _, frame = next(renderer.frames(frames=1))
+    assert set(frame.tobytes().decode("ascii")) <= set(renderer.ramp + renderer.background)